@@ -6,16 +6,22 @@ and updates task logs and outbox with status messages.
 Supports dependency-aware execution with depends_on metadata.
 """
 
+import hashlib
+import io
 import json
+import mmap
+import os
 import argparse
 import sys
 import uuid
 import logging
 from datetime import datetime
 from pathlib import Path
-from jsonschema import validate, ValidationError
-import glob
+import orjson
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import SchemaError, best_match
 import re
+from collections import defaultdict, deque
 
 # Add the parent directory to the path so we can import context_manager
 sys.path.insert(0, str(Path(__file__).parent))
@@ -28,12 +34,37 @@ logger = logging.getLogger(__name__)
 # Performance threshold for warnings
 LOW_SUCCESS_RATE_THRESHOLD = 0.85
 
+# Layout of a single task_log.md entry
+_LOG_ENTRY_TEMPLATE = (
+    "\n## {timestamp}\n"
+    "**Status**: {icon} {status}\n"
+    "**Message ID**: {message_id}\n"
+    "**From**: {sender}\n"
+    "**Type**: {type}\n"
+    "{task_line}"
+    "{learning_line}"
+    "**Details**: {details}\n"
+)
+
+# Fields of each line in postbox/*/task_log.jsonl
+_LOG_RECORD_FIELDS = ('timestamp', 'task_id', 'status', 'message_id', 'sender', 'type')
+
+# Digests of the schemas that already passed the meta-schema check in this process
+_CHECKED_SCHEMAS = set()
+
+# Level 2 and 3 headings in the shared context file
+_SECTION_RE = re.compile(r'^#{2,3} .+$', re.MULTILINE)
+
+# Entry headers and the fields of interest in postbox/*/task_log.md; a bytes
+# pattern so logs can be scanned in place through mmap
+_LOG_FIELD_RE = re.compile(rb"^(?:## .*|\*\*(Status|Task ID)\*\*:(.*))$", re.MULTILINE)
+
 
 def load_learning_data(learning_file='insights/agent_learning_snapshot.json'):
     """Load agent learning data from snapshot file."""
     try:
-        with open(learning_file, 'r') as f:
-            return json.load(f)
+        with open(learning_file, 'rb') as f:
+            return orjson.loads(f.read())
     except FileNotFoundError:
         logger.warning(f"Learning data file not found: {learning_file}")
         return None
@@ -56,13 +87,16 @@ def check_agent_performance(agent, task_type, learning_data):
     return success_rate, avg_duration
 
 
-def log_performance_warning(agent, task_type, success_rate):
-    """Log a warning if agent has low success rate for task type."""
+def log_performance_warning(agent, task_type, success_rate, out=None):
+    """Log a warning if agent has low success rate for task type.
+    
+    The warning is also printed to out (defaults to stdout).
+    """
     if success_rate and success_rate < LOW_SUCCESS_RATE_THRESHOLD:
         warning_msg = (f"⚠️  Warning: Agent {agent} has low success rate ({success_rate:.1%}) "
                       f"for task type '{task_type}'")
         logger.warning(warning_msg)
-        print(warning_msg)
+        print(warning_msg, file=out)
         return True
     return False
 
@@ -83,8 +117,8 @@ def load_text_file(filepath):
 def load_json_file(filepath):
     """Load JSON content from a file."""
     try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
     except FileNotFoundError:
         print(f"Error: File not found - {filepath}")
         sys.exit(1)
@@ -94,92 +128,282 @@ def load_json_file(filepath):
 
 
 def save_json_file(filepath, data):
-    """Save JSON content to a file."""
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    """Save JSON content to a file.
+    
+    The data is written to a temporary file that then replaces the target,
+    so readers never see a partially written file.
+    """
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, filepath)
 
 
-def validate_message(message, schema):
-    """Validate a message against the exchange protocol schema."""
+def build_validator(schema, schema_digest=None):
+    """Check the exchange protocol schema once and compile a reusable validator.
+    
+    Checking the schema against the draft-07 meta-schema costs far more than
+    building the validator. When schema_digest (a SHA-256 of the schema file)
+    is given, the check is only done once per process for that exact schema.
+    """
+    if schema_digest is None or schema_digest not in _CHECKED_SCHEMAS:
+        Draft7Validator.check_schema(schema)
+        if schema_digest is not None:
+            _CHECKED_SCHEMAS.add(schema_digest)
+    
+    return Draft7Validator(schema)
+
+
+def _last_non_space(f, end):
+    """Return the offset of the last non-whitespace byte before end, or -1."""
+    while end > 0:
+        start = max(0, end - 1024)
+        f.seek(start)
+        chunk = f.read(end - start).rstrip()
+        if chunk:
+            return start + len(chunk) - 1
+        end = start
+    return -1
+
+
+def _write_all(f, data):
+    """Write all of data to an unbuffered file, which may accept it in parts."""
+    view = memoryview(data)
+    while view:
+        view = view[f.write(view):]
+
+
+def _append_in_place(filepath, encoded):
+    """Splice encoded array items in before the closing bracket of a JSON array file.
+    
+    Returns False, leaving the file alone, if it is missing, empty or not an
+    array. If the write fails (for example on a full disk), the original
+    closing bytes are put back so the file is valid JSON again, and the error
+    is raised.
+    """
+    try:
+        f = open(filepath, 'r+b', buffering=0)
+    except FileNotFoundError:
+        return False
+    
+    with f:
+        closing = _last_non_space(f, f.seek(0, 2))
+        if closing == -1:
+            return False
+        f.seek(closing)
+        if f.read(1) != b']':
+            return False
+        
+        previous = _last_non_space(f, closing)
+        f.seek(previous)
+        separator = b"\n" if f.read(1) == b'[' else b",\n"
+        tail = f.read()
+        
+        try:
+            f.seek(previous + 1)
+            _write_all(f, separator + encoded + b"\n]")
+            f.truncate()
+            os.fsync(f.fileno())
+        except OSError:
+            f.seek(previous + 1)
+            _write_all(f, tail)
+            f.truncate()
+            raise
+    return True
+
+
+def append_to_json_array(filepath, items):
+    """Append items to a JSON array file without rewriting existing entries.
+    
+    Only the tail of the file is touched, so the cost depends on the number
+    of new items rather than on the size of the file. The output matches
+    what save_json_file writes for the whole array. A missing, empty or
+    non-array file is replaced by an array holding just the new items.
+    
+    Unlike save_json_file, the append is not atomic: a crash while the tail
+    is being written can leave the file without its closing bracket. Write
+    errors are handled by restoring the old tail and falling back to a full
+    rewrite through save_json_file.
+    """
+    if not items:
+        return
+    
+    # Each item indented one level, as it appears inside the array; JSON
+    # strings never contain raw newlines, so splitting on them is safe
+    encoded = b",\n".join(
+        b"\n".join(b"  " + line for line in orjson.dumps(item, option=orjson.OPT_INDENT_2).split(b"\n"))
+        for item in items
+    )
+    
     try:
-        validate(instance=message, schema=schema)
+        if _append_in_place(filepath, encoded):
+            return
+        existing = []
+    except OSError as e:
+        logger.warning(f"Appending to {filepath} failed ({e}); rewriting it")
+        with open(filepath, 'rb') as f:
+            existing = orjson.loads(f.read())
+    
+    save_json_file(filepath, existing + list(items))
+
+
+def validate_message(message, validator):
+    """Validate a message against the compiled exchange protocol validator."""
+    # Cheap early exit for messages missing a required top-level field
+    if isinstance(message, dict):
+        for key in validator.schema.get('required', ()):
+            if key not in message:
+                return False, f"'{key}' is a required property"
+    
+    error = best_match(validator.iter_errors(message))
+    if error is None:
         return True, None
-    except ValidationError as e:
-        return False, str(e)
+    return False, str(error)
 
 
-def check_task_completed(task_id):
-    """Check if a task is marked as completed by searching outboxes and task logs."""
-    # Check all agent outboxes for task_status messages
-    outbox_files = glob.glob("postbox/*/outbox.json")
+def completed_from_task_log(content):
+    """Return the task IDs recorded as successful in a task log.
     
-    for outbox_file in outbox_files:
-        try:
-            with open(outbox_file, 'r') as f:
-                messages = json.load(f)
-                
-            for msg in messages:
-                if (msg.get('type') == 'task_status' and 
-                    msg.get('content', {}).get('task_id') == task_id and
-                    msg.get('content', {}).get('status') == 'completed'):
-                    return True
-        except (json.JSONDecodeError, FileNotFoundError):
-            continue
+    The log is parsed entry by entry in a single pass, so a status is only
+    ever matched with the task ID of the same entry.
     
-    # Check all task logs for completed status
-    log_files = glob.glob("postbox/*/task_log.md")
+    Args:
+        content: The raw log as bytes or any buffer (such as an mmap)
+    """
+    completed = set()
+    task_id = None
+    success = False
+    
+    for match in _LOG_FIELD_RE.finditer(content):
+        field, value = match.groups()
+        if field is None:
+            # A new entry starts; settle the previous one
+            if success and task_id:
+                completed.add(task_id)
+            task_id = None
+            success = False
+        elif field == b'Status':
+            success = b'Success' in value
+        else:
+            task_id = value.strip().decode('utf-8', 'replace') or None
     
-    for log_file in log_files:
+    if success and task_id:
+        completed.add(task_id)
+    
+    return completed
+
+
+def completed_from_task_records(path):
+    """Return the task IDs recorded as successful in a task_log.jsonl file."""
+    completed = set()
+    try:
+        with open(path, 'rb') as f:
+            for line in f:
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                if record.get('status') == 'Success' and record.get('task_id'):
+                    completed.add(record['task_id'])
+    except FileNotFoundError:
+        pass
+    return completed
+
+
+def build_completed_index():
+    """Collect the IDs of all completed tasks from agent outboxes and task logs.
+    
+    Every outbox and task log is read once, so dependency checks for the
+    whole inbox become set lookups.
+    """
+    completed = set()
+    
+    try:
+        with os.scandir("postbox") as it:
+            agent_dirs = [entry.path for entry in it
+                          if entry.is_dir() and not entry.name.startswith('.')]
+    except FileNotFoundError:
+        return completed
+    
+    for agent_dir in agent_dirs:
+        # One directory listing per agent; the entries cache file types and
+        # stat results, so empty files are skipped without being opened
+        with os.scandir(agent_dir) as it:
+            files = {entry.name: entry for entry in it if entry.is_file()}
+        
+        # Check the agent's outbox for task_status messages
+        outbox = files.get('outbox.json')
+        if outbox is not None and outbox.stat().st_size:
+            try:
+                with open(outbox.path, 'rb') as f:
+                    messages = orjson.loads(f.read())
+            except (json.JSONDecodeError, FileNotFoundError):
+                messages = []
+            
+            for msg in messages:
+                content = msg.get('content', {})
+                if msg.get('type') == 'task_status' and content.get('status') == 'completed':
+                    completed.add(content.get('task_id'))
+        
+        # Check the agent's task logs for completed status. Both are read:
+        # the structured log is only written by this runner, while other
+        # tools still append to the markdown one
+        if 'task_log.jsonl' in files:
+            completed.update(completed_from_task_records(files['task_log.jsonl'].path))
+        
+        # The markdown log is mapped rather than read into memory
+        log = files.get('task_log.md')
+        if log is None or not log.stat().st_size:
+            continue
         try:
-            with open(log_file, 'r') as f:
-                content = f.read()
-                
-            # Look for completed task entries
-            if re.search(f"\\*\\*Task ID\\*\\*: {re.escape(task_id)}.*?\\*\\*Status\\*\\*:.*?Success", 
-                        content, re.DOTALL):
-                return True
+            with open(log.path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                completed.update(completed_from_task_log(content))
         except FileNotFoundError:
             continue
     
-    return False
+    return completed
 
 
-def check_dependencies_met(message):
-    """Check if all dependencies for a task are met."""
-    depends_on = message.get('metadata', {}).get('depends_on', [])
-    
-    if not depends_on:
-        return True, []
-    
-    missing_deps = []
-    for dep_task_id in depends_on:
-        if not check_task_completed(dep_task_id):
-            missing_deps.append(dep_task_id)
+def check_dependencies_met(message, completed):
+    """Check if all dependencies for a task are met.
     
+    Args:
+        message: The task message to check
+        completed: Set of completed task IDs (see build_completed_index)
+        
+    Returns:
+        Tuple of (all_met: bool, missing_deps: list)
+    """
+    depends_on = message.get('metadata', {}).get('depends_on', [])
+    missing_deps = [dep for dep in depends_on if dep not in completed]
     return len(missing_deps) == 0, missing_deps
 
 
-def simulate_task_execution(message, agent_context=None):
+def simulate_task_execution(message, agent_context=None, out=None, timestamp=None):
     """Simulate task execution and return execution result.
     
     Args:
         message: The task message to process
         agent_context: The agent's context dictionary (may be modified)
+        out: Stream for progress output (defaults to stdout)
+        timestamp: ISO timestamp to record for the task (defaults to now)
         
     Returns:
         Tuple of (success: bool, details: str, updated_context: dict)
     """
     task_type = message.get('content', {}).get('type', 'unknown')
     task_id = message.get('content', {}).get('task_id', 'unknown')
+    timestamp = timestamp or datetime.now().isoformat()
     
-    print(f"\n{'='*40}")
-    print(f"SIMULATING TASK EXECUTION")
-    print(f"Task ID: {task_id}")
-    print(f"Type: {task_type}")
-    print(f"From: {message.get('sender', 'unknown')}")
-    print(f"To: {message.get('recipient', 'unknown')}")
-    print(f"Agent Context: {'Available' if agent_context else 'Not available'}")
-    print(f"{'='*40}")
+    print(f"\n{'='*40}\n"
+          f"SIMULATING TASK EXECUTION\n"
+          f"Task ID: {task_id}\n"
+          f"Type: {task_type}\n"
+          f"From: {message.get('sender', 'unknown')}\n"
+          f"To: {message.get('recipient', 'unknown')}\n"
+          f"Agent Context: {'Available' if agent_context else 'Not available'}\n"
+          f"{'='*40}", file=out)
     
     # Initialize context if not provided
     if agent_context is None:
@@ -195,14 +419,14 @@ def simulate_task_execution(message, agent_context=None):
     task_entry = {
         'task_id': task_id,
         'type': task_type,
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': timestamp,
         'status': 'completed'
     }
     agent_context['history']['tasks'].append(task_entry)
     
     # Update last active time
     agent_context['state'] = agent_context.get('state', {})
-    agent_context['state']['last_active'] = datetime.now().isoformat()
+    agent_context['state']['last_active'] = timestamp
     
     # Simulate different outcomes based on task type
     if task_type == 'data_processing':
@@ -215,52 +439,92 @@ def simulate_task_execution(message, agent_context=None):
         return True, f"Task {task_id} executed successfully", agent_context
 
 
-def append_to_task_log(agent, message, success, details, learning_applied=False):
-    """Append an entry to the agent's task log."""
-    log_path = Path(f"postbox/{agent}/task_log.md")
+def append_to_task_log(log_buffer, message, success, details, learning_applied=False, timestamp=None):
+    """Buffer an entry for the agent's task log.
+    
+    Entries are written in one batch by flush_task_log at the end of the run.
+    """
+    task_id = message['content']['task_id'] if message['type'] == 'task_assignment' else None
     
-    # Ensure the file exists
+    log_buffer.append({
+        'timestamp': timestamp or datetime.now().isoformat(),
+        'task_id': task_id,
+        'status': 'Success' if success else 'Failed',
+        'message_id': message['id'],
+        'sender': message['sender'],
+        'type': message['type'],
+        'learning_applied': learning_applied,
+        'details': details,
+    })
+
+
+def _format_log_entry(entry):
+    """Render a buffered task log entry as markdown."""
+    return _LOG_ENTRY_TEMPLATE.format_map({
+        **entry,
+        'icon': "✅" if entry['status'] == 'Success' else "❌",
+        'task_line': f"**Task ID**: {entry['task_id']}\n" if entry['task_id'] is not None else "",
+        'learning_line': "**Learning Applied**: Yes\n" if entry['learning_applied'] else "",
+    })
+
+
+def flush_task_log(log_path, agent, log_buffer, out=None):
+    """Append all buffered entries to the agent's task log in a single write.
+    
+    Every entry is also appended as one JSON line to the structured log next
+    to the markdown one (task_log.jsonl). Dependency checks read both logs.
+    """
+    if not log_buffer:
+        return
+    
+    # Ensure the file exists; its postbox directory holds the inbox we just read
     if not log_path.exists():
-        log_path.parent.mkdir(parents=True, exist_ok=True)
         with open(log_path, 'w') as f:
             f.write(f"# Task Log - {agent}\n\n")
     
-    timestamp = datetime.now().isoformat()
-    status_icon = "✅" if success else "❌"
-    
-    log_entry = f"\n## {timestamp}\n"
-    log_entry += f"**Status**: {status_icon} {'Success' if success else 'Failed'}\n"
-    log_entry += f"**Message ID**: {message['id']}\n"
-    log_entry += f"**From**: {message['sender']}\n"
-    log_entry += f"**Type**: {message['type']}\n"
-    
-    if message['type'] == 'task_assignment':
-        log_entry += f"**Task ID**: {message['content']['task_id']}\n"
+    with open(log_path, 'a', buffering=1 << 16) as f:
+        f.write(''.join(_format_log_entry(entry) for entry in log_buffer))
     
-    if learning_applied:
-        log_entry += f"**Learning Applied**: Yes\n"
+    records = [{field: entry[field] for field in _LOG_RECORD_FIELDS} for entry in log_buffer]
+    with open(log_path.with_suffix('.jsonl'), 'ab') as f:
+        f.write(b''.join(orjson.dumps(record) + b'\n' for record in records))
     
-    log_entry += f"**Details**: {details}\n"
-    
-    with open(log_path, 'a') as f:
-        f.write(log_entry)
-    
-    print(f"   📝 Updated task log: {log_path}")
+    print(f"   📝 Updated task log: {log_path} ({len(log_buffer)} entries)", file=out)
+    log_buffer.clear()
+
 
+def uuid4_batch(count):
+    """Yield count UUID4 strings drawn from a single os.urandom() call."""
+    pool = os.urandom(16 * count)
+    for offset in range(0, len(pool), 16):
+        yield str(uuid.UUID(bytes=pool[offset:offset + 16], version=4))
 
-def create_status_message(agent, original_message, success, details):
-    """Create a task status message for the outbox."""
+
+def create_status_message(agent, original_message, status, progress, details, extra_metadata=None,
+                          timestamp=None, message_id=None):
+    """Create a task status message for the outbox.
+    
+    Args:
+        agent: The agent reporting the status
+        original_message: The message the status refers to
+        status: Task status (e.g. completed, failed)
+        progress: Task progress percentage
+        details: Human readable details
+        extra_metadata: Additional fields merged into the message metadata
+        timestamp: Message timestamp (defaults to now)
+        message_id: Message ID (defaults to a fresh UUID)
+    """
     status_message = {
         "type": "task_status",
-        "id": str(uuid.uuid4()),
-        "timestamp": datetime.now().isoformat(),
+        "id": message_id or str(uuid.uuid4()),
+        "timestamp": timestamp or datetime.now().isoformat(),
         "sender": agent,
         "recipient": original_message['sender'],
         "version": "1.0.0",
         "content": {
             "task_id": original_message['content'].get('task_id', 'N/A'),
-            "status": "completed" if success else "failed",
-            "progress": 100 if success else 0,
+            "status": status,
+            "progress": progress,
             "details": details
         },
         "metadata": {
@@ -268,24 +532,41 @@ def create_status_message(agent, original_message, success, details):
             "original_message_id": original_message['id']
         }
     }
+    if extra_metadata:
+        status_message["metadata"].update(extra_metadata)
     
     return status_message
 
 
-def process_inbox(agent, schema, simulate=True, clear=False, force=False, context_dir='context', use_learning=False):
+def process_inbox(agent, validator, simulate=True, clear=False, force=False, context_dir='context',
+                  use_learning=False, quiet=False):
     """Process all messages in the agent's inbox.
     
     Args:
         agent: The agent ID to process messages for
-        schema: The JSON schema to validate messages against
+        validator: Compiled schema validator (see build_validator)
         simulate: Whether to simulate task execution
         clear: Whether to clear processed messages from the inbox
         force: Whether to force execution even if dependencies aren't met
         context_dir: Directory containing context files
         use_learning: Whether to use learning-based decision making
+        quiet: Whether to suppress progress output
     """
-    inbox_path = Path(f"postbox/{agent}/inbox.json")
-    outbox_path = Path(f"postbox/{agent}/outbox.json")
+    # Progress output is buffered and written to stdout once per message
+    # rather than once per line
+    out = io.StringIO()
+    
+    def flush_output():
+        if not quiet:
+            sys.stdout.write(out.getvalue())
+        out.seek(0)
+        out.truncate()
+    
+    # The agent's postbox paths are fixed for the whole run
+    postbox_dir = Path("postbox") / agent
+    inbox_path = postbox_dir / "inbox.json"
+    outbox_path = postbox_dir / "outbox.json"
+    log_path = postbox_dir / "task_log.md"
     
     # Initialize context manager
     context_manager = ContextManager(context_dir)
@@ -300,97 +581,152 @@ def process_inbox(agent, schema, simulate=True, clear=False, force=False, contex
     
     # Load inbox
     if not inbox_path.exists():
-        print(f"No inbox found for agent {agent}")
+        print(f"No inbox found for agent {agent}", file=out)
+        flush_output()
         return
     
     try:
-        with open(inbox_path, 'r') as f:
-            inbox = json.load(f)
+        with open(inbox_path, 'rb') as f:
+            inbox = orjson.loads(f.read())
     except json.JSONDecodeError as e:
-        print(f"Error reading inbox for {agent}: {e}")
+        print(f"Error reading inbox for {agent}: {e}", file=out)
+        flush_output()
         return
     
     if not isinstance(inbox, list):
-        print(f"Invalid inbox format for {agent}")
+        print(f"Invalid inbox format for {agent}", file=out)
+        flush_output()
         return
     
     if not inbox:
-        print(f"No messages in {agent}'s inbox")
+        print(f"No messages in {agent}'s inbox", file=out)
+        flush_output()
         return
     
-    print(f"\nProcessing {len(inbox)} message(s) in {agent}'s inbox...")
+    print(f"\nProcessing {len(inbox)} message(s) in {agent}'s inbox...", file=out)
     
     # Load learning data if enabled
     learning_data = None
     if use_learning:
         learning_data = load_learning_data()
         if learning_data:
-            print("Learning data loaded - will make performance-aware decisions")
+            print("Learning data loaded - will make performance-aware decisions", file=out)
         else:
-            print("Warning: --use-learning enabled but no learning data found")
-    
-    # Load outbox
-    outbox = []
-    if outbox_path.exists():
-        try:
-            with open(outbox_path, 'r') as f:
-                outbox = json.load(f)
-                if not isinstance(outbox, list):
-                    outbox = []
-        except (json.JSONDecodeError, FileNotFoundError):
-            outbox = []
-    
-    processed_messages = []
+            print("Warning: --use-learning enabled but no learning data found", file=out)
+    flush_output()
+    
+    processed_ids = set()
+    new_status_msgs = []
+    # At most one status message is produced per inbox message
+    status_ids = uuid4_batch(len(inbox))
+    log_buffer = []
+    
+    # Index completed tasks once for all dependency checks in this run; the
+    # scan reads every agent's outbox and log, so skip it when no message
+    # declares dependencies
+    needs_index = not force and any(
+        isinstance(m, dict) and (m.get('metadata') or {}).get('depends_on') for m in inbox
+    )
+    completed = build_completed_index() if needs_index else set()
     context_modified = False
     
-    for message in inbox:
+    # Order execution by dependency rather than inbox position: messages whose
+    # dependencies are met run in inbox order, and a blocked message is queued
+    # as soon as the last task it is waiting on completes in this run.
+    ready = deque()
+    blocked = defaultdict(list)  # task ID -> indexes of messages waiting on it
+    waiting = {}                 # message index -> task IDs it still waits on
+    for index, message in enumerate(inbox):
         try:
-            # Validate message against schema
-            validate(instance=message, schema=schema)
+            is_valid, error = validate_message(message, validator)
+            if not is_valid:
+                print(f"Invalid message format: {error}", file=out)
+                continue
             
             # Check dependencies if not forcing
-            if not force and not check_dependencies_met(message):
-                print(f"Skipping {message.get('id', 'unknown')}: Dependencies not met")
-                continue
+            if not force:
+                deps_met, missing_deps = check_dependencies_met(message, completed)
+                if not deps_met:
+                    waiting[index] = set(missing_deps)
+                    for dep in waiting[index]:
+                        blocked[dep].append(index)
+                    continue
             
+            ready.append(index)
+        except Exception as e:
+            print(f"Error processing message: {e}", file=out)
+    flush_output()
+    
+    while ready:
+        message = inbox[ready.popleft()]
+        # One timestamp for everything recorded about this message
+        ts = datetime.now().isoformat()
+        try:
             # Check agent performance for this task type if learning is enabled
             if use_learning and learning_data:
                 task_type = message.get('content', {}).get('task_description', '').split(':')[0].strip()
                 performance = check_agent_performance(learning_data, agent, task_type)
                 if performance and 'success_rate' in performance and performance['success_rate'] < LOW_SUCCESS_RATE_THRESHOLD:
-                    log_performance_warning(agent, task_type, performance)
-            
-            # Make a copy of the context for this task
-            task_context = json.loads(json.dumps(agent_context)) if agent_context else {}
+                    log_performance_warning(agent, task_type, performance, out)
             
             # Simulate task execution with context
             if simulate:
-                success, details, updated_context = simulate_task_execution(message, task_context)
-                
-                # Check if context was modified
-                if json.dumps(task_context) != json.dumps(agent_context):
-                    agent_context = updated_context
-                    context_modified = True
-                    logger.debug(f"Context updated during task execution for {agent}")
+                # Every change is kept and the context is saved once after the
+                # loop, so the simulator updates it in place; it always records
+                # the task in the context history
+                success, details, agent_context = simulate_task_execution(message, agent_context, out, ts)
+                context_modified = True
+                logger.debug(f"Context updated during task execution for {agent}")
             else:
                 success = True
                 details = "Simulation skipped"
             
             # Log the result (track if learning was applied for this task)
             learning_applied = use_learning and learning_data is not None
-            append_to_task_log(agent, message, success, details, learning_applied)
+            append_to_task_log(log_buffer, message, success, details, learning_applied, ts)
             
             # Create status message
-            status_msg = create_status_message(agent, message, success, details)
-            outbox.append(status_msg)
+            status_msg = create_status_message(
+                agent, message,
+                status='completed' if success else 'failed',
+                progress=100 if success else 0,
+                details=details,
+                timestamp=ts,
+                message_id=next(status_ids)
+            )
+            new_status_msgs.append(status_msg)
+            
+            print(f"Processed message {message.get('id', 'unknown')}: {'✓' if success else '✗'}", file=out)
+            processed_ids.add(message['id'])
             
-            print(f"Processed message {message.get('id', 'unknown')}: {'✓' if success else '✗'}")
-            processed_messages.append(message['id'])
+            # Release messages in this inbox that were waiting on this task
+            if success and message['type'] == 'task_assignment':
+                task_id = message['content'].get('task_id')
+                completed.add(task_id)
+                for index in blocked.pop(task_id, ()):
+                    waiting[index].discard(task_id)
+                    if not waiting[index]:
+                        del waiting[index]
+                        ready.append(index)
             
-        except ValidationError as e:
-            print(f"Invalid message format: {e}")
         except Exception as e:
-            print(f"Error processing message: {e}")
+            print(f"Error processing message: {e}", file=out)
+        finally:
+            flush_output()
+    
+    # Anything still waiting depends on tasks that did not complete
+    for index in waiting:
+        message = inbox[index]
+        _, missing_deps = check_dependencies_met(message, completed)
+        print(f"Skipping {message.get('id', 'unknown')}: Dependencies not met "
+              f"({', '.join(missing_deps)})", file=out)
+    flush_output()
+    
+    # Write all task log entries from this run at once
+    try:
+        flush_task_log(log_path, agent, log_buffer, out)
+    except Exception as e:
+        print(f"Error writing task log: {e}", file=out)
     
     # Save updated context if modified
     if context_modified:
@@ -402,22 +738,22 @@ def process_inbox(agent, schema, simulate=True, clear=False, force=False, contex
         except Exception as e:
             logger.error(f"Error saving context for {agent}: {e}")
     
-    # Save outbox
+    # Append this run's status messages to the outbox
     try:
-        with open(outbox_path, 'w') as f:
-            json.dump(outbox, f, indent=2)
+        append_to_json_array(outbox_path, new_status_msgs)
     except Exception as e:
-        print(f"Error saving outbox: {e}")
+        print(f"Error saving outbox: {e}", file=out)
     
     # Clear processed messages from inbox if requested
-    if clear and processed_messages:
-        remaining_messages = [msg for msg in inbox if msg.get('id') not in processed_messages]
+    if clear and processed_ids:
+        remaining_messages = [msg for msg in inbox if msg.get('id') not in processed_ids]
         try:
-            with open(inbox_path, 'w') as f:
-                json.dump(remaining_messages, f, indent=2)
-            print(f"\nCleared {len(processed_messages)} processed message(s) from inbox")
+            save_json_file(inbox_path, remaining_messages)
+            print(f"\nCleared {len(processed_ids)} processed message(s) from inbox", file=out)
         except Exception as e:
-            print(f"Error clearing inbox: {e}")
+            print(f"Error clearing inbox: {e}", file=out)
+    
+    flush_output()
 
 
 def agent_init(agent):
@@ -471,14 +807,14 @@ def agent_init(agent):
         }
         
         if agent in agent_sections:
-            section_start = context_content.find(agent_sections[agent])
-            if section_start != -1:
-                # Find the next section or end of agent roles
-                next_section = context_content.find("###", section_start + 1)
-                communication_section = context_content.find("## Communication Model")
-                end_point = min(filter(lambda x: x > section_start, 
-                                     [next_section if next_section != -1 else len(context_content),
-                                      communication_section if communication_section != -1 else len(context_content)]))
+            # Offsets of every level 2/3 heading, in document order
+            headers = [(m.start(), m.group()) for m in _SECTION_RE.finditer(context_content)]
+            index = next((i for i, (_, title) in enumerate(headers)
+                          if title.rstrip() == agent_sections[agent]), None)
+            if index is not None:
+                # The section runs until the next heading or the end of the file
+                section_start = headers[index][0]
+                end_point = headers[index + 1][0] if index + 1 < len(headers) else len(context_content)
                 
                 agent_section = context_content[section_start:end_point].strip()
                 print(agent_section)
@@ -519,13 +855,13 @@ def main():
                        help='Enable debug logging')
     parser.add_argument('--use-learning', action='store_true',
                        help='Enable learning-based decision making')
+    parser.add_argument('--quiet', '-q', action='store_true',
+                       help='Suppress progress output')
     
     args = parser.parse_args()
     
-    # Configure logging
-    log_level = logging.DEBUG if args.debug else logging.INFO
-    logging.basicConfig(level=log_level, 
-                       format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    # Logging is configured at import; only the level depends on the flags
+    logging.getLogger().setLevel(logging.DEBUG if args.debug else logging.INFO)
     
     if args.init:
         agent_init(args.agent)
@@ -533,8 +869,9 @@ def main():
     
     # Load schema
     try:
-        with open(args.schema, 'r') as f:
-            schema = json.load(f)
+        with open(args.schema, 'rb') as f:
+            schema_bytes = f.read()
+        schema = orjson.loads(schema_bytes)
     except FileNotFoundError:
         print(f"Schema file not found: {args.schema}")
         sys.exit(1)
@@ -542,18 +879,27 @@ def main():
         print(f"Invalid JSON in schema file: {e}")
         sys.exit(1)
     
+    # Compile the validator once for the whole run
+    try:
+        validator = build_validator(schema, hashlib.sha256(schema_bytes).hexdigest())
+    except SchemaError as e:
+        print(f"Invalid schema in {args.schema}: {e.message}")
+        sys.exit(1)
+    
     # Process inbox
     process_inbox(
         agent=args.agent,
-        schema=schema,
+        validator=validator,
         simulate=not args.no_simulate,
         clear=args.clear,
         force=args.force,
         context_dir=args.context_dir,
-        use_learning=args.use_learning
+        use_learning=args.use_learning,
+        quiet=args.quiet
     )
     
-    print("\n✨ Agent Runner completed successfully")
+    if not args.quiet:
+        print("\n✨ Agent Runner completed successfully")
 
 
 if __name__ == "__main__":
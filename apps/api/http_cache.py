@@ -0,0 +1,81 @@
+"""
+Caching helpers for the Bluelabel Agent OS API.
+Lets slowly changing, frequently polled endpoints reuse recent results and
+answer repeat polls with 304 Not Modified.
+"""
+import functools
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+import orjson
+from fastapi import Request, Response
+
+# Dashboards poll these endpoints every few seconds
+CACHE_CONTROL = "max-age=5, stale-while-revalidate=30"
+RESULT_TTL = 2.0  # seconds
+
+
+def ttl_cache(seconds: float, maxsize: int = 128) -> Callable:
+    """Memoize a function's results per argument tuple for a short time.
+    
+    Exceptions are not cached. Expired entries are dropped as new results are
+    stored, and beyond maxsize entries the oldest go first. Safe to call from
+    the threadpool that runs plain `def` handlers.
+    """
+    def decorator(func: Callable) -> Callable:
+        # Entries are kept oldest first, as (time stored, result)
+        cache: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        lock = threading.Lock()
+        
+        @functools.wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            with lock:
+                hit = cache.get(args)
+            if hit and now - hit[0] < seconds:
+                return hit[1]
+            
+            result = func(*args)
+            with lock:
+                cache[args] = (now, result)
+                cache.move_to_end(args)
+                while cache:
+                    oldest, (stamp, _) = next(iter(cache.items()))
+                    if len(cache) <= maxsize and now - stamp < seconds:
+                        break
+                    del cache[oldest]
+            return result
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def etag_json_response(request: Request, payload: Any) -> Response:
+    """Serialize a payload and tag it with an ETag derived from the bytes.
+    
+    Args:
+        request: The incoming request, checked for If-None-Match
+        payload: JSON-ready data to send
+        
+    Returns:
+        Response: 304 Not Modified if the client's copy is current, otherwise the JSON body
+    """
+    body = orjson.dumps(payload)
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
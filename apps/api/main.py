@@ -2,18 +2,28 @@
 Main FastAPI application for the Bluelabel Agent OS API.
 Exposes system state to frontend through HTTP endpoints.
 """
+import functools
+import logging
 import os
 from datetime import datetime
 from typing import List, Optional
 
-from fastapi import FastAPI, HTTPException, Query, Path
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Path, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from models.agent import Agent, AgentList
 from models.task import Task, TaskList, TaskStatus
-from sample_data import AGENTS, AGENTS_BY_ID, TASKS, TASKS_BY_ID
+from sample_data import (
+    AGENTS_LIST_JSON, AGENTS_LIST_JSON_BY_STATUS, AGENTS_JSON_BY_ID_CI, TASK_DICTS_BY_ID, TASKS_JSON_BY_ID, TASKS_SORTED,
+    TASKS_BY_STATUS, TASKS_BY_AGENT, TASKS_BY_STATUS_AND_AGENT,
+)
 from routers import plans, metrics, history, actions
+from services.timestamps import parse_iso
+
+# Configure logging once for the application and its routers
+logging.basicConfig(level=logging.INFO)
 
 # Create FastAPI application
 app = FastAPI(
@@ -37,23 +47,34 @@ app.include_router(plans.router)
 app.include_router(metrics.router)
 app.include_router(actions.router)
 
+# Handler convention, for this module and the routers: endpoints that do
+# blocking work (in-memory lookups or file reads and writes) are plain `def`,
+# which FastAPI runs in its threadpool; `async def` is reserved for handlers
+# that await.
+
+# Everything in the health response but the timestamp is fixed
+_HEALTH_HEAD = b'{"status":"healthy","timestamp":"'
+_HEALTH_TAIL = b'","version":' + orjson.dumps(app.version) + b'}'
+
+
 @app.get("/health", tags=["Health"])
-async def health_check():
+def health_check():
     """
     Simple heartbeat endpoint to check API health.
     
     Returns:
         dict: Status information including timestamp
     """
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "version": app.version
-    }
+    timestamp = datetime.utcnow().isoformat().encode() + b"Z"
+    return Response(_HEALTH_HEAD + timestamp + _HEALTH_TAIL, media_type="application/json")
+
 
+# Response for a status no agent has
+_EMPTY_AGENT_LIST = b'{"agents":[],"count":0}'
 
-@app.get("/agents", response_model=AgentList, tags=["Agents"])
-async def get_agents(
+
+@app.get("/agents", responses={200: {"model": AgentList}}, tags=["Agents"])
+def get_agents(
     status: Optional[str] = Query(None, description="Filter agents by status")
 ):
     """
@@ -65,20 +86,17 @@ async def get_agents(
     Returns:
         AgentList: List of agents and count
     """
-    filtered_agents = AGENTS
+    body = AGENTS_LIST_JSON
     
     # Apply status filter if provided
     if status:
-        filtered_agents = [
-            agent for agent in AGENTS 
-            if agent.status.value.lower() == status.lower()
-        ]
+        body = AGENTS_LIST_JSON_BY_STATUS.get(status.lower(), _EMPTY_AGENT_LIST)
     
-    return AgentList(agents=filtered_agents, count=len(filtered_agents))
+    return Response(body, media_type="application/json")
 
 
-@app.get("/agents/{agent_id}", response_model=Agent, tags=["Agents"])
-async def get_agent(
+@app.get("/agents/{agent_id}", responses={200: {"model": Agent}}, tags=["Agents"])
+def get_agent(
     agent_id: str = Path(..., description="The ID of the agent to retrieve")
 ):
     """
@@ -93,15 +111,48 @@ async def get_agent(
     Raises:
         HTTPException: If agent not found
     """
-    agent_id = agent_id.upper()
-    if agent_id not in AGENTS_BY_ID:
-        raise HTTPException(status_code=404, detail=f"Agent {agent_id} not found")
+    body = AGENTS_JSON_BY_ID_CI.get(agent_id.casefold())
+    if body is None:
+        raise HTTPException(status_code=404, detail=f"Agent {agent_id.upper()} not found")
     
-    return AGENTS_BY_ID[agent_id]
+    return Response(body, media_type="application/json")
+
 
+# Valid status filters, and the response when a filter matches no task
+_TASK_STATUSES = frozenset(status.value for status in TaskStatus)
+_EMPTY_TASK_LIST = b'{"tasks":[],"count":0}'
 
-@app.get("/tasks", response_model=TaskList, tags=["Tasks"])
-async def get_tasks(
+
+@functools.lru_cache(maxsize=256)
+def _tasks_page(status: Optional[str], agent_id: Optional[str], limit: int, offset: int) -> bytes:
+    """
+    Serialize one page of tasks for normalized filters.
+    
+    Pages are cached because the sample tasks never change; call
+    _tasks_page.cache_clear() if they ever do.
+    """
+    # Pick the precomputed index for the filters given; each is already
+    # sorted by updated_at or created_at (newest first)
+    if status and agent_id:
+        filtered_tasks = TASKS_BY_STATUS_AND_AGENT.get((status, agent_id), [])
+    elif status:
+        filtered_tasks = TASKS_BY_STATUS.get(status, [])
+    elif agent_id:
+        filtered_tasks = TASKS_BY_AGENT.get(agent_id, [])
+    else:
+        filtered_tasks = TASKS_SORTED
+    
+    # Apply pagination
+    paginated_tasks = filtered_tasks[offset:offset + limit]
+    
+    return orjson.dumps({
+        "tasks": [TASK_DICTS_BY_ID[task.id] for task in paginated_tasks],
+        "count": len(filtered_tasks),
+    })
+
+
+@app.get("/tasks", responses={200: {"model": TaskList}}, tags=["Tasks"])
+def get_tasks(
     status: Optional[str] = Query(None, description="Filter tasks by status"),
     agent_id: Optional[str] = Query(None, description="Filter tasks by agent ID"),
     limit: int = Query(10, description="Maximum number of tasks to return"),
@@ -119,37 +170,19 @@ async def get_tasks(
     Returns:
         TaskList: List of tasks and count
     """
-    filtered_tasks = TASKS
-    
-    # Apply status filter if provided
-    if status:
-        filtered_tasks = [
-            task for task in filtered_tasks 
-            if task.status.value.lower() == status.lower()
-        ]
-    
-    # Apply agent filter if provided
-    if agent_id:
-        agent_id = agent_id.upper()
-        filtered_tasks = [
-            task for task in filtered_tasks 
-            if task.agent_id.upper() == agent_id
-        ]
+    status = status.lower() if status else None
+    agent_id = agent_id.casefold() if agent_id else None
     
-    # Sort by updated_at or created_at (newest first)
-    filtered_tasks.sort(
-        key=lambda x: (x.updated_at or x.created_at),
-        reverse=True
-    )
+    # Filters that cannot match anything are answered without touching the
+    # page cache, so arbitrary query strings cannot evict real pages
+    if (status and status not in _TASK_STATUSES) or (agent_id and agent_id not in TASKS_BY_AGENT):
+        return Response(_EMPTY_TASK_LIST, media_type="application/json")
     
-    # Apply pagination
-    paginated_tasks = filtered_tasks[offset:offset + limit]
-    
-    return TaskList(tasks=paginated_tasks, count=len(filtered_tasks))
+    return Response(_tasks_page(status, agent_id, limit, offset), media_type="application/json")
 
 
-@app.get("/tasks/{task_id}", response_model=Task, tags=["Tasks"])
-async def get_task(
+@app.get("/tasks/{task_id}", responses={200: {"model": Task}}, tags=["Tasks"])
+def get_task(
     task_id: str = Path(..., description="The ID of the task to retrieve")
 ):
     """
@@ -164,21 +197,24 @@ async def get_task(
     Raises:
         HTTPException: If task not found
     """
-    if task_id not in TASKS_BY_ID:
+    body = TASKS_JSON_BY_ID.get(task_id)
+    if body is None:
         raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
     
-    return TASKS_BY_ID[task_id]
+    return Response(body, media_type="application/json")
 
 
 class RecentTask(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     trace_id: str
     agent: str
     score: Optional[float]
     retry_count: int
     success: bool
-    submitted_at: Optional[str] = None
-    started_at: Optional[str] = None
-    completed_at: Optional[str] = None
+    submitted_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
     duration_sec: Optional[float] = None
     input_payload: Optional[dict] = None
     output_payload: Optional[dict] = None
@@ -189,8 +225,83 @@ class RecentTasksResponse(BaseModel):
     count: int
 
 
-@app.get("/tasks/recent", response_model=RecentTasksResponse, tags=["Tasks"])
-async def get_recent_tasks(
+# Sample recent tasks data with more realistic information; the data is
+# constant, so it is serialized once at import. Every value below already has
+# its field's type, which is what makes skipping validation with
+# model_construct safe; keep it that way when editing the list.
+_RECENT_TASKS = [
+    RecentTask.model_construct(
+        trace_id="summary-ARCH-1737071400",
+        agent="ARCH",
+        score=0.95,
+        success=True,
+        retry_count=0,
+        duration_sec=2.3,
+        submitted_at=parse_iso("2025-01-16T23:50:00Z"),
+        started_at=parse_iso("2025-01-16T23:50:01Z"),
+        completed_at=parse_iso("2025-01-16T23:50:03Z"),
+        input_payload={"task": "orchestrate_plan", "plan_id": "plan_001"},
+        output_payload={"status": "completed", "tasks_assigned": 3}
+    ),
+    RecentTask.model_construct(
+        trace_id="summary-CA-1737071100",
+        agent="CA",
+        score=0.89,
+        success=True,
+        retry_count=1,
+        duration_sec=4.7,
+        submitted_at=parse_iso("2025-01-16T23:45:00Z"),
+        started_at=parse_iso("2025-01-16T23:45:02Z"),
+        completed_at=parse_iso("2025-01-16T23:45:07Z"),
+        input_payload={"task": "analyze_context", "data": "user_request"},
+        output_payload={"analysis": "task_classification", "confidence": 0.89}
+    ),
+    RecentTask.model_construct(
+        trace_id="summary-CC-1737070800",
+        agent="CC", 
+        score=0.92,
+        success=True,
+        retry_count=0,
+        duration_sec=1.8,
+        submitted_at=parse_iso("2025-01-16T23:40:00Z"),
+        started_at=parse_iso("2025-01-16T23:40:01Z"),
+        completed_at=parse_iso("2025-01-16T23:40:03Z"),
+        input_payload={"task": "generate_code", "requirements": "api_endpoint"},
+        output_payload={"code_generated": True, "files_created": 2}
+    ),
+    RecentTask.model_construct(
+        trace_id="summary-WA-1737070500",
+        agent="WA",
+        score=0.87,
+        success=True,
+        retry_count=0,
+        duration_sec=3.1,
+        submitted_at=parse_iso("2025-01-16T23:35:00Z"),
+        started_at=parse_iso("2025-01-16T23:35:01Z"),
+        completed_at=parse_iso("2025-01-16T23:35:04Z"),
+        input_payload={"task": "web_interaction", "url": "https://example.com"},
+        output_payload={"data_extracted": True, "pages_processed": 1}
+    ),
+    RecentTask.model_construct(
+        trace_id="failed-task-1737070200",
+        agent="CC",
+        score=0.25,
+        success=False,
+        retry_count=3,
+        duration_sec=12.5,
+        submitted_at=parse_iso("2025-01-16T23:30:00Z"),
+        started_at=parse_iso("2025-01-16T23:30:02Z"),
+        completed_at=parse_iso("2025-01-16T23:30:15Z"),
+        input_payload={"task": "complex_analysis", "timeout": 10},
+        output_payload={"error": "timeout_exceeded", "partial_results": True}
+    )
+]
+_RECENT_TASKS_PAYLOAD = [task.model_dump(mode="json") for task in _RECENT_TASKS]
+_RECENT_TASKS_BODY = orjson.dumps({"tasks": _RECENT_TASKS_PAYLOAD, "count": len(_RECENT_TASKS)})
+
+
+@app.get("/tasks/recent", responses={200: {"model": RecentTasksResponse}}, tags=["Tasks"])
+def get_recent_tasks(
     limit: int = Query(10, description="Maximum number of tasks to return"),
     offset: int = Query(0, description="Number of tasks to skip")
 ):
@@ -204,80 +315,16 @@ async def get_recent_tasks(
     Returns:
         RecentTasksResponse: List of recent tasks with execution details
     """
-    # Sample recent tasks data with more realistic information
-    sample_tasks = [
-        RecentTask(
-            trace_id="summary-ARCH-1737071400",
-            agent="ARCH",
-            score=0.95,
-            success=True,
-            retry_count=0,
-            duration_sec=2.3,
-            submitted_at="2025-01-16T23:50:00Z",
-            started_at="2025-01-16T23:50:01Z",
-            completed_at="2025-01-16T23:50:03Z",
-            input_payload={"task": "orchestrate_plan", "plan_id": "plan_001"},
-            output_payload={"status": "completed", "tasks_assigned": 3}
-        ),
-        RecentTask(
-            trace_id="summary-CA-1737071100",
-            agent="CA",
-            score=0.89,
-            success=True,
-            retry_count=1,
-            duration_sec=4.7,
-            submitted_at="2025-01-16T23:45:00Z",
-            started_at="2025-01-16T23:45:02Z",
-            completed_at="2025-01-16T23:45:07Z",
-            input_payload={"task": "analyze_context", "data": "user_request"},
-            output_payload={"analysis": "task_classification", "confidence": 0.89}
-        ),
-        RecentTask(
-            trace_id="summary-CC-1737070800",
-            agent="CC", 
-            score=0.92,
-            success=True,
-            retry_count=0,
-            duration_sec=1.8,
-            submitted_at="2025-01-16T23:40:00Z",
-            started_at="2025-01-16T23:40:01Z",
-            completed_at="2025-01-16T23:40:03Z",
-            input_payload={"task": "generate_code", "requirements": "api_endpoint"},
-            output_payload={"code_generated": True, "files_created": 2}
-        ),
-        RecentTask(
-            trace_id="summary-WA-1737070500",
-            agent="WA",
-            score=0.87,
-            success=True,
-            retry_count=0,
-            duration_sec=3.1,
-            submitted_at="2025-01-16T23:35:00Z",
-            started_at="2025-01-16T23:35:01Z",
-            completed_at="2025-01-16T23:35:04Z",
-            input_payload={"task": "web_interaction", "url": "https://example.com"},
-            output_payload={"data_extracted": True, "pages_processed": 1}
-        ),
-        RecentTask(
-            trace_id="failed-task-1737070200",
-            agent="CC",
-            score=0.25,
-            success=False,
-            retry_count=3,
-            duration_sec=12.5,
-            submitted_at="2025-01-16T23:30:00Z",
-            started_at="2025-01-16T23:30:02Z",
-            completed_at="2025-01-16T23:30:15Z",
-            input_payload={"task": "complex_analysis", "timeout": 10},
-            output_payload={"error": "timeout_exceeded", "partial_results": True}
-        )
-    ]
+    # The default page covers every task, so serve the prebuilt body
+    if offset == 0 and limit >= len(_RECENT_TASKS):
+        return Response(_RECENT_TASKS_BODY, media_type="application/json")
     
     # Apply pagination
-    total_count = len(sample_tasks)
-    paginated_tasks = sample_tasks[offset:offset + limit]
-    
-    return RecentTasksResponse(tasks=paginated_tasks, count=total_count)
+    body = orjson.dumps({
+        "tasks": _RECENT_TASKS_PAYLOAD[offset:offset + limit],
+        "count": len(_RECENT_TASKS),
+    })
+    return Response(body, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -286,4 +333,6 @@ if __name__ == "__main__":
     # Get port from environment variable or use default 8000
     port = int(os.environ.get("PORT", 8000))
     
-    uvicorn.run("apps.api.main:app", host="0.0.0.0", port=port, reload=True)
\ No newline at end of file
+    # uvicorn[standard] brings uvloop and httptools, which uvicorn picks up
+    # automatically; per-request access logging is left off
+    uvicorn.run("apps.api.main:app", host="0.0.0.0", port=port, reload=True, access_log=False)
\ No newline at end of file
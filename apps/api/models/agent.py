@@ -3,7 +3,7 @@ Agent data models for the Bluelabel Agent OS API.
 """
 from enum import Enum
 from typing import Dict, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AgentStatus(str, Enum):
@@ -39,8 +39,10 @@ class Agent(BaseModel):
     tasks_failed: int = 0
     tasks_in_progress: int = 0
     
-    class Config:
-        schema_extra = {
+    # Instances are shared across requests, so they are read-only
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "id": "CC",
                 "name": "Claude Code",
@@ -54,6 +56,7 @@ class Agent(BaseModel):
                 "tasks_in_progress": 2
             }
         }
+    )
 
 
 class AgentList(BaseModel):
@@ -1,11 +1,20 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any, Union
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+# Allowed values, in the order they are listed in error messages
+_PRIORITIES = ('low', 'medium', 'high', 'critical')
+_AGENTS = ('CA', 'CC', 'WA', 'ARCH')
+_PLAN_STATUSES = ('validated', 'processing', 'rejected', 'queued')
+
+_VALID_PRIORITIES = frozenset(_PRIORITIES)
+_VALID_AGENTS = frozenset(_AGENTS)
+_VALID_PLAN_STATUSES = frozenset(_PLAN_STATUSES)
+
 class TaskMetadata(BaseModel):
     """Optional metadata for a task in the plan."""
     priority: Optional[str] = Field(None, description="Task priority level")
-    deadline: Optional[str] = Field(None, description="ISO 8601 deadline timestamp")
+    deadline: Optional[datetime] = Field(None, description="ISO 8601 deadline timestamp")
     timeout: Optional[str] = Field(None, description="Task timeout (e.g., '30m', '1h')")
     retries: Optional[int] = Field(None, description="Number of retry attempts allowed")
 
@@ -16,7 +25,7 @@ class PlanTask(BaseModel):
     type: str = Field("task_assignment", description="Message type from protocol")
     description: str = Field(..., description="Human-readable task description")
     priority: Optional[str] = Field("medium", description="Task priority (low, medium, high, critical)")
-    deadline: Optional[str] = Field(None, description="ISO 8601 timestamp for task deadline")
+    deadline: Optional[datetime] = Field(None, description="ISO 8601 timestamp for task deadline")
     content: Dict[str, Any] = Field(..., description="Task-specific content and parameters")
     dependencies: List[str] = Field(default_factory=list, description="List of task_ids that must complete before this task")
     max_retries: Optional[int] = Field(1, description="Maximum retry attempts for this task")
@@ -27,17 +36,18 @@ class PlanTask(BaseModel):
     @field_validator('priority')
     @classmethod
     def validate_priority(cls, v):
-        valid_priorities = ['low', 'medium', 'high', 'critical']
-        if v and v.lower() not in valid_priorities:
-            raise ValueError(f"Priority must be one of: {', '.join(valid_priorities)}")
-        return v.lower() if v else 'medium'
+        if not v:
+            return 'medium'
+        v = v.lower()
+        if v not in _VALID_PRIORITIES:
+            raise ValueError(f"Priority must be one of: {', '.join(_PRIORITIES)}")
+        return v
 
     @field_validator('agent')
     @classmethod
     def validate_agent(cls, v):
-        valid_agents = ['CA', 'CC', 'WA', 'ARCH']
-        if v not in valid_agents:
-            raise ValueError(f"Agent must be one of: {', '.join(valid_agents)}")
+        if v not in _VALID_AGENTS:
+            raise ValueError(f"Agent must be one of: {', '.join(_AGENTS)}")
         return v
     
     @field_validator('dependencies')
@@ -51,7 +61,7 @@ class PlanMetadata(BaseModel):
     """Metadata for an execution plan."""
     plan_id: str = Field(..., description="Unique identifier for this plan")
     version: str = Field("1.0.0", description="Plan format version")
-    created: Optional[str] = Field(None, description="ISO 8601 timestamp of plan creation")
+    created: Optional[datetime] = Field(None, description="ISO 8601 timestamp of plan creation")
     description: str = Field(..., description="Description of what this plan does")
     priority: Optional[str] = Field("medium", description="Overall plan priority")
     timeout: Optional[str] = Field(None, description="Maximum time for plan execution")
@@ -59,15 +69,17 @@ class PlanMetadata(BaseModel):
     @field_validator('created', mode='before')
     @classmethod
     def set_created(cls, v):
-        return v or datetime.utcnow().isoformat()
+        return v or datetime.now(timezone.utc)
 
     @field_validator('priority')
     @classmethod
     def validate_priority(cls, v):
-        valid_priorities = ['low', 'medium', 'high', 'critical']
-        if v and v.lower() not in valid_priorities:
-            raise ValueError(f"Priority must be one of: {', '.join(valid_priorities)}")
-        return v.lower() if v else 'medium'
+        if not v:
+            return 'medium'
+        v = v.lower()
+        if v not in _VALID_PRIORITIES:
+            raise ValueError(f"Priority must be one of: {', '.join(_PRIORITIES)}")
+        return v
 
 class ExecutionPlan(BaseModel):
     """Complete execution plan with metadata and tasks."""
@@ -80,10 +92,11 @@ class ExecutionPlan(BaseModel):
         tasks = self.tasks
         task_ids = {task.task_id for task in tasks}
         
-        for task in tasks:
-            for dep_id in task.dependencies:
-                if dep_id not in task_ids:
-                    raise ValueError(f"Task {task.task_id} depends on undefined task {dep_id}")
+        # Stop at the first dependency on an unknown task
+        bad = next(((task.task_id, dep_id) for task in tasks for dep_id in task.dependencies
+                    if dep_id not in task_ids), None)
+        if bad:
+            raise ValueError(f"Task {bad[0]} depends on undefined task {bad[1]}")
         
         return self
 
@@ -98,9 +111,8 @@ class PlanResponse(BaseModel):
     @field_validator('status')
     @classmethod
     def validate_status(cls, v):
-        valid_statuses = ['validated', 'processing', 'rejected', 'queued']
-        if v not in valid_statuses:
-            raise ValueError(f"Status must be one of: {', '.join(valid_statuses)}")
+        if v not in _VALID_PLAN_STATUSES:
+            raise ValueError(f"Status must be one of: {', '.join(_PLAN_STATUSES)}")
         return v
 
 class PlanRequest(BaseModel):
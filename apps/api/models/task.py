@@ -4,7 +4,7 @@ Task data models for the Bluelabel Agent OS API.
 from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TaskStatus(str, Enum):
@@ -41,8 +41,10 @@ class Task(BaseModel):
     details: List[str] = []
     content: Optional[Dict[str, Any]] = None
     
-    class Config:
-        schema_extra = {
+    # Instances are shared across requests, so they are read-only
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "id": "TASK-001",
                 "description": "Process data files",
@@ -63,6 +65,7 @@ class Task(BaseModel):
                 }
             }
         }
+    )
 
 
 class TaskList(BaseModel):
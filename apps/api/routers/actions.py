@@ -2,25 +2,103 @@
 Task and Plan Action Router for Bluelabel Agent OS API.
 Provides endpoints for task control operations like resubmit, escalate, and cancel.
 """
-import json
+import asyncio
+import atexit
 import logging
 import os
+from collections import deque
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Deque, Dict, Any, List, Optional
 
-from fastapi import APIRouter, HTTPException, Path
+import orjson
+from fastapi import APIRouter, HTTPException, Path, Response
 from pydantic import BaseModel, Field
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured once by the application (see main.py)
 logger = logging.getLogger(__name__)
 
+# Action log records are queued by the handlers and written out in batches
+LOG_DIR = "logs"
+LOG_FILE = f"{LOG_DIR}/plan_actions.log"
+LOG_FLUSH_INTERVAL = 0.1  # seconds
+_LOG_QUEUE: Deque[Dict[str, Any]] = deque()
+
+def _write_log_batch(batch: List[Dict[str, Any]]) -> None:
+    """Append a batch of log records to the action log with a single write."""
+    try:
+        with open(LOG_FILE, "ab") as f:
+            f.write(b"".join(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE) for entry in batch))
+    except Exception as e:
+        logger.error(f"Failed to log {len(batch)} action(s): {e}")
+
+def _drain_log_queue() -> List[Dict[str, Any]]:
+    """Take every queued log record off the queue."""
+    batch = []
+    while _LOG_QUEUE:
+        batch.append(_LOG_QUEUE.popleft())
+    return batch
+
+def flush_action_log() -> None:
+    """Write any queued action log records synchronously."""
+    batch = _drain_log_queue()
+    if batch:
+        os.makedirs(LOG_DIR, exist_ok=True)
+        _write_log_batch(batch)
+
+# API escalations are appended to an NDJSON inbox, one message per line,
+# next to the inbox.json written by the other tools; tools/inbox_monitor.py
+# reads both
+HUMAN_INBOX_DIR = "postbox/HUMAN"
+HUMAN_INBOX_NDJSON = f"{HUMAN_INBOX_DIR}/inbox.ndjson"
+
+def _append_to_inbox(message: Dict[str, Any]) -> None:
+    """Append a message to inbox.ndjson, creating the HUMAN postbox if needed."""
+    # Escalations run on the threadpool and need no lock: each one is a
+    # single unbuffered write() in append mode, so concurrent lines never
+    # overwrite or interleave with each other
+    line = orjson.dumps(message, option=orjson.OPT_APPEND_NEWLINE)
+    try:
+        f = open(HUMAN_INBOX_NDJSON, "ab", buffering=0)
+    except FileNotFoundError:
+        # Normally created at startup; only reached if it was removed since
+        os.makedirs(HUMAN_INBOX_DIR, exist_ok=True)
+        f = open(HUMAN_INBOX_NDJSON, "ab", buffering=0)
+    with f:
+        f.write(line)
+
+async def _flush_loop() -> None:
+    """Periodically hand queued log records to a worker thread for writing."""
+    while True:
+        await asyncio.sleep(LOG_FLUSH_INTERVAL)
+        batch = _drain_log_queue()
+        if batch:
+            await asyncio.to_thread(_write_log_batch, batch)
+
+@asynccontextmanager
+async def _action_log_lifespan(app):
+    """Run the action log flusher for the lifetime of the application."""
+    # Created once here so the request path never has to check for them
+    os.makedirs(LOG_DIR, exist_ok=True)
+    os.makedirs(HUMAN_INBOX_DIR, exist_ok=True)
+    flusher = asyncio.create_task(_flush_loop())
+    try:
+        yield
+    finally:
+        flusher.cancel()
+        flush_action_log()
+
+# Records queued outside a running app (or after it stops) are still written
+atexit.register(flush_action_log)
+
 router = APIRouter(
     prefix="/api/v1",
-    tags=["Actions"]
+    tags=["Actions"],
+    lifespan=_action_log_lifespan
 )
 
-# Response models
+# Response models; ActionResult documents the action responses, which are
+# sent as plain dicts
 class ActionResult(BaseModel):
     """Standard response model for action endpoints."""
     success: bool = Field(..., description="Whether the action completed successfully")
@@ -30,46 +108,39 @@ class ActionResult(BaseModel):
     timestamp: str = Field(..., description="ISO timestamp when action was performed")
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional action metadata")
 
-class ResubmitMetadata(BaseModel):
-    """Metadata specific to resubmit actions."""
-    original_submission_time: Optional[str] = None
-    resubmission_count: int = 1
-    reason: str = "Manual resubmission requested"
-
-class EscalationMetadata(BaseModel):
-    """Metadata specific to escalation actions."""
-    escalation_level: str = "HUMAN"
-    escalated_to: str = "human-inbox"
-    priority: str = "normal"
-    reason: str = "Manual escalation requested"
-
-class CancellationMetadata(BaseModel):
-    """Metadata specific to cancellation actions."""
-    cancelled_by: str = "api-request"
-    reason: str = "Manual cancellation requested"
-    final_status: str = "cancelled"
+# Metadata added to every API action, by action; only the resubmission
+# time ("original_submission_time") varies per request
+_RESUBMIT_META_TEMPLATE = {
+    "resubmission_count": 1,
+    "reason": "Manual resubmission via API"
+}
+_ESCALATION_META_TEMPLATE = {
+    "escalation_level": "HUMAN",
+    "escalated_to": "human-inbox",
+    "priority": "normal",
+    "reason": "Manual escalation via API"
+}
+_CANCELLATION_META_TEMPLATE = {
+    "cancelled_by": "api-request",
+    "reason": "Manual cancellation via API",
+    "final_status": "cancelled"
+}
 
 # Helper functions
-def log_action_event(plan_id: str, action: str, metadata: Dict[str, Any]) -> None:
-    """Log action events to a structured log file."""
+def log_action_event(plan_id: str, action: str, metadata: Dict[str, Any],
+                     timestamp: Optional[datetime] = None) -> None:
+    """Queue an action event for the structured log file."""
     log_entry = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": timestamp or datetime.now(timezone.utc),
         "plan_id": plan_id,
         "action": action,
         "metadata": metadata
     }
     
-    # Ensure logs directory exists
-    os.makedirs("logs", exist_ok=True)
-    
-    # Append to action log file
-    log_file = "logs/plan_actions.log"
-    try:
-        with open(log_file, "a") as f:
-            f.write(json.dumps(log_entry) + "\n")
+    # Written to logs/plan_actions.log by the next flush
+    _LOG_QUEUE.append(log_entry)
+    if logger.isEnabledFor(logging.INFO):
         logger.info(f"Logged {action} action for plan {plan_id}")
-    except Exception as e:
-        logger.error(f"Failed to log action: {e}")
 
 def simulate_plan_resubmission(plan_id: str) -> Dict[str, Any]:
     """Simulate resubmitting a plan to the system."""
@@ -99,7 +170,7 @@ def simulate_plan_resubmission(plan_id: str) -> Dict[str, Any]:
     
     return metadata
 
-def simulate_plan_escalation(plan_id: str) -> Dict[str, Any]:
+def simulate_plan_escalation(plan_id: str, now: Optional[datetime] = None) -> Dict[str, Any]:
     """Simulate escalating a plan to human review."""
     # In a real implementation, this would:
     # 1. Create an escalation record
@@ -108,37 +179,26 @@ def simulate_plan_escalation(plan_id: str) -> Dict[str, Any]:
     # 4. Trigger notification (email, Slack, etc.)
     
     # For now, simulate writing to a human inbox
-    human_inbox_dir = "postbox/HUMAN"
-    os.makedirs(human_inbox_dir, exist_ok=True)
+    now = now or datetime.now(timezone.utc)
     
     escalation_message = {
         "type": "plan_escalation",
         "plan_id": plan_id,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": now,
         "priority": "normal",
         "message": f"Plan {plan_id} has been escalated for human review",
         "requested_by": "api-action-endpoint"
     }
     
     # Write to human inbox
-    inbox_file = f"{human_inbox_dir}/inbox.json"
     try:
-        if os.path.exists(inbox_file):
-            with open(inbox_file, "r") as f:
-                inbox_data = json.load(f)
-        else:
-            inbox_data = []
-        
-        inbox_data.append(escalation_message)
-        
-        with open(inbox_file, "w") as f:
-            json.dump(inbox_data, f, indent=2)
+        _append_to_inbox(escalation_message)
         
         return {
             "simulated": True,
-            "escalation_written_to": inbox_file,
+            "escalation_written_to": HUMAN_INBOX_NDJSON,
             "action_taken": "Escalation message written to HUMAN inbox",
-            "message_id": f"escalation_{plan_id}_{int(datetime.now().timestamp())}"
+            "message_id": f"escalation_{plan_id}_{int(now.timestamp())}"
         }
     except Exception as e:
         logger.error(f"Failed to write escalation: {e}")
@@ -172,10 +232,10 @@ def simulate_plan_cancellation(plan_id: str) -> Dict[str, Any]:
     return metadata
 
 # Action endpoints
-@router.post("/plans/{plan_id}/resubmit", response_model=ActionResult)
-async def resubmit_plan(
+@router.post("/plans/{plan_id}/resubmit", responses={200: {"model": ActionResult}})
+def resubmit_plan(
     plan_id: str = Path(..., description="The ID of the plan to resubmit")
-):
+) -> Response:
     """
     Resubmit a plan for execution.
     
@@ -188,34 +248,31 @@ async def resubmit_plan(
     Returns:
         ActionResult: Result of the resubmission action
     """
+    now = datetime.now(timezone.utc)
+    now_iso = now.isoformat()
     try:
         # Simulate resubmission
         sim_metadata = simulate_plan_resubmission(plan_id)
         
-        # Create response metadata
-        resubmit_meta = ResubmitMetadata(
-            original_submission_time=datetime.now(timezone.utc).isoformat(),
-            resubmission_count=1,
-            reason="Manual resubmission via API"
-        )
-        
         # Combine metadata
         full_metadata = {
             **sim_metadata,
-            **resubmit_meta.dict()
+            "original_submission_time": now_iso,
+            **_RESUBMIT_META_TEMPLATE
         }
         
         # Log the action
-        log_action_event(plan_id, "resubmit", full_metadata)
+        log_action_event(plan_id, "resubmit", full_metadata, now)
         
-        return ActionResult(
-            success=True,
-            message=f"Plan {plan_id} has been resubmitted for execution",
-            plan_id=plan_id,
-            action="resubmit",
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            metadata=full_metadata
-        )
+        body = orjson.dumps({
+            "success": True,
+            "message": f"Plan {plan_id} has been resubmitted for execution",
+            "plan_id": plan_id,
+            "action": "resubmit",
+            "timestamp": now_iso,
+            "metadata": full_metadata
+        })
+        return Response(body, media_type="application/json")
         
     except Exception as e:
         logger.error(f"Failed to resubmit plan {plan_id}: {e}")
@@ -224,10 +281,10 @@ async def resubmit_plan(
             detail=f"Failed to resubmit plan: {str(e)}"
         )
 
-@router.post("/plans/{plan_id}/escalate", response_model=ActionResult)
-async def escalate_plan(
+@router.post("/plans/{plan_id}/escalate", responses={200: {"model": ActionResult}})
+def escalate_plan(
     plan_id: str = Path(..., description="The ID of the plan to escalate")
-):
+) -> Response:
     """
     Escalate a plan to human review.
     
@@ -240,35 +297,30 @@ async def escalate_plan(
     Returns:
         ActionResult: Result of the escalation action
     """
+    now = datetime.now(timezone.utc)
+    now_iso = now.isoformat()
     try:
         # Simulate escalation
-        sim_metadata = simulate_plan_escalation(plan_id)
-        
-        # Create response metadata
-        escalation_meta = EscalationMetadata(
-            escalation_level="HUMAN",
-            escalated_to="human-inbox",
-            priority="normal",
-            reason="Manual escalation via API"
-        )
+        sim_metadata = simulate_plan_escalation(plan_id, now)
         
         # Combine metadata
         full_metadata = {
             **sim_metadata,
-            **escalation_meta.dict()
+            **_ESCALATION_META_TEMPLATE
         }
         
         # Log the action
-        log_action_event(plan_id, "escalate", full_metadata)
+        log_action_event(plan_id, "escalate", full_metadata, now)
         
-        return ActionResult(
-            success=True,
-            message=f"Plan {plan_id} has been escalated to human review",
-            plan_id=plan_id,
-            action="escalate",
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            metadata=full_metadata
-        )
+        body = orjson.dumps({
+            "success": True,
+            "message": f"Plan {plan_id} has been escalated to human review",
+            "plan_id": plan_id,
+            "action": "escalate",
+            "timestamp": now_iso,
+            "metadata": full_metadata
+        })
+        return Response(body, media_type="application/json")
         
     except Exception as e:
         logger.error(f"Failed to escalate plan {plan_id}: {e}")
@@ -277,10 +329,10 @@ async def escalate_plan(
             detail=f"Failed to escalate plan: {str(e)}"
         )
 
-@router.post("/plans/{plan_id}/cancel", response_model=ActionResult)
-async def cancel_plan(
+@router.post("/plans/{plan_id}/cancel", responses={200: {"model": ActionResult}})
+def cancel_plan(
     plan_id: str = Path(..., description="The ID of the plan to cancel")
-):
+) -> Response:
     """
     Cancel a plan and mark it as inactive.
     
@@ -293,34 +345,30 @@ async def cancel_plan(
     Returns:
         ActionResult: Result of the cancellation action
     """
+    now = datetime.now(timezone.utc)
+    now_iso = now.isoformat()
     try:
         # Simulate cancellation
         sim_metadata = simulate_plan_cancellation(plan_id)
         
-        # Create response metadata
-        cancel_meta = CancellationMetadata(
-            cancelled_by="api-request",
-            reason="Manual cancellation via API",
-            final_status="cancelled"
-        )
-        
         # Combine metadata
         full_metadata = {
             **sim_metadata,
-            **cancel_meta.dict()
+            **_CANCELLATION_META_TEMPLATE
         }
         
         # Log the action
-        log_action_event(plan_id, "cancel", full_metadata)
+        log_action_event(plan_id, "cancel", full_metadata, now)
         
-        return ActionResult(
-            success=True,
-            message=f"Plan {plan_id} has been cancelled and marked inactive",
-            plan_id=plan_id,
-            action="cancel",
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            metadata=full_metadata
-        )
+        body = orjson.dumps({
+            "success": True,
+            "message": f"Plan {plan_id} has been cancelled and marked inactive",
+            "plan_id": plan_id,
+            "action": "cancel",
+            "timestamp": now_iso,
+            "metadata": full_metadata
+        })
+        return Response(body, media_type="application/json")
         
     except Exception as e:
         logger.error(f"Failed to cancel plan {plan_id}: {e}")
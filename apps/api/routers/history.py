@@ -1,9 +1,12 @@
 """
 API routes for task and plan history endpoints.
 """
-from typing import Optional
-from fastapi import APIRouter, HTTPException, Query
+from typing import Any, Dict, Optional
 
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+
+from http_cache import RESULT_TTL, etag_json_response, ttl_cache
 from models.history import PlanHistoryList, TaskRecentList
 from services.history_service import HistoryService
 
@@ -13,10 +16,31 @@ router = APIRouter(tags=["History"])
 history_service = HistoryService()
 
 
-@router.get("/plans/history", response_model=PlanHistoryList)
-async def get_plan_history(
+# Dashboards poll with the same arguments every few seconds, so the
+# JSON-ready payloads are reused briefly instead of rescanning the logs
+@ttl_cache(RESULT_TTL)
+def _plan_history_payload(limit: int) -> Dict[str, Any]:
+    plan_history = history_service.get_plan_history(limit)
+    return {
+        "plans": [plan.model_dump(mode="json") for plan in plan_history],
+        "count": len(plan_history),
+    }
+
+
+@ttl_cache(RESULT_TTL)
+def _recent_tasks_payload(limit: int, hours: int) -> Dict[str, Any]:
+    recent_tasks = history_service.get_recent_tasks(limit, hours)
+    return {
+        "tasks": [task.model_dump(mode="json") for task in recent_tasks],
+        "count": len(recent_tasks),
+    }
+
+
+@router.get("/plans/history", responses={200: {"model": PlanHistoryList}})
+def get_plan_history(
+    request: Request,
     limit: int = Query(50, description="Maximum number of plans to return", ge=1, le=200)
-) -> PlanHistoryList:
+) -> Response:
     """
     Get plan execution history.
     
@@ -30,17 +54,16 @@ async def get_plan_history(
         PlanHistoryList: List of plan history items with execution details
     """
     try:
-        plan_history = history_service.get_plan_history(limit)
-        return PlanHistoryList(plans=plan_history, count=len(plan_history))
+        return etag_json_response(request, _plan_history_payload(limit))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve plan history: {str(e)}")
 
 
-@router.get("/tasks/recent", response_model=TaskRecentList)
-async def get_recent_tasks(
+@router.get("/tasks/recent", responses={200: {"model": TaskRecentList}})
+def get_recent_tasks(
     limit: int = Query(100, description="Maximum number of tasks to return", ge=1, le=500),
     hours: int = Query(24, description="Number of hours to look back", ge=1, le=168)
-) -> TaskRecentList:
+) -> Response:
     """
     Get recent task executions.
     
@@ -55,7 +78,6 @@ async def get_recent_tasks(
         TaskRecentList: List of recent task items with execution details
     """
     try:
-        recent_tasks = history_service.get_recent_tasks(limit, hours)
-        return TaskRecentList(tasks=recent_tasks, count=len(recent_tasks))
+        return Response(orjson.dumps(_recent_tasks_payload(limit, hours)), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve recent tasks: {str(e)}")
\ No newline at end of file
@@ -1,9 +1,10 @@
 """
 API routes for metrics endpoints.
 """
-from typing import List
-from fastapi import APIRouter, HTTPException, Path
+from typing import Any, Dict, List
+from fastapi import APIRouter, HTTPException, Path, Request, Response
 
+from http_cache import etag_json_response
 from models.metrics import AgentMetrics, AgentMetricsList, PlanMetrics
 from services.metrics_service import MetricsService
 
@@ -13,8 +14,18 @@ router = APIRouter(prefix="/metrics", tags=["Metrics"])
 metrics_service = MetricsService()
 
 
-@router.get("/agents", response_model=AgentMetricsList)
-async def get_agent_metrics() -> AgentMetricsList:
+# Not cached here: the score log is parsed through the service's file cache,
+# which is invalidated as soon as the file changes
+def _agent_metrics_payload() -> Dict[str, Any]:
+    agent_metrics = metrics_service.get_agent_metrics()
+    return {
+        "agents": [agent.model_dump(mode="json") for agent in agent_metrics],
+        "count": len(agent_metrics),
+    }
+
+
+@router.get("/agents", responses={200: {"model": AgentMetricsList}})
+def get_agent_metrics(request: Request) -> Response:
     """
     Get performance metrics for all agents.
     
@@ -25,14 +36,13 @@ async def get_agent_metrics() -> AgentMetricsList:
         AgentMetricsList: List of agent metrics including success rates and scores
     """
     try:
-        agent_metrics = metrics_service.get_agent_metrics()
-        return AgentMetricsList(agents=agent_metrics, count=len(agent_metrics))
+        return etag_json_response(request, _agent_metrics_payload())
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve agent metrics: {str(e)}")
 
 
 @router.get("/plans/{plan_id}", response_model=PlanMetrics)
-async def get_plan_metrics(
+def get_plan_metrics(
     plan_id: str = Path(..., description="The ID of the plan to get metrics for")
 ) -> PlanMetrics:
     """
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from fastapi import APIRouter, HTTPException, Depends, Body, Query
 from typing import List, Optional, Dict, Any
 from models.plan import PlanRequest, PlanResponse, ExecutionPlan
@@ -5,7 +6,9 @@ from services.plan_service import PlanService
 
 router = APIRouter(prefix="/plans", tags=["plans"])
 
-# Dependency to get plan service instance
+# Dependency to get the plan service; one instance is shared by all requests
+# so plans submitted in one request are visible to the next
+@lru_cache(maxsize=None)
 def get_plan_service() -> PlanService:
     return PlanService()
 
@@ -44,12 +47,13 @@ async def get_plan_status(
     if not plan_status:
         raise HTTPException(status_code=404, detail=f"Plan {plan_id} not found")
     
-    # Convert plan to dict for response
-    plan_dict = plan_status.copy()
-    plan_dict["plan"] = plan_status["plan"].dict()
-    plan_dict["created_at"] = plan_dict["created_at"].isoformat()
-    
-    return plan_dict
+    # Convert plan to a JSON-ready dict for response; created_at is the only
+    # other field that is not already JSON-ready
+    return {
+        **plan_status,
+        "plan": plan_status["plan"].model_dump(mode="json"),
+        "created_at": plan_status["created_at"].isoformat()
+    }
 
 @router.get("/", response_model=List[Dict[str, Any]])
 async def list_plans(
@@ -64,18 +68,12 @@ async def list_plans(
     Returns:
         List[Dict[str, Any]]: List of plans with their metadata
     """
-    plans = await plan_service.list_plans()
-    
-    if status:
-        plans = [plan for plan in plans if plan["status"] == status]
-        
-    return plans
+    return await plan_service.list_plans(status=status)
 
 @router.get("/history", response_model=Dict[str, Any])
-async def get_plan_history(
+def get_plan_history(
     limit: int = Query(10, description="Number of plans to return"),
-    offset: int = Query(0, description="Number of plans to skip"),
-    plan_service: PlanService = Depends(get_plan_service)
+    offset: int = Query(0, description="Number of plans to skip")
 ) -> Dict[str, Any]:
     """Get plan history with pagination.
     
@@ -86,9 +84,6 @@ async def get_plan_history(
     Returns:
         Dict[str, Any]: Plans history with count
     """
-    # Get all plans and return a sample for now
-    plans = await plan_service.list_plans()
-    
     # Sample plan history data
     sample_plans = [
         {
@@ -3,7 +3,9 @@ Sample data for the Bluelabel Agent OS API.
 This will be replaced with actual data in a production environment.
 """
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Any, Dict, List, Tuple
+
+import orjson
 
 from models.agent import Agent, AgentStatus, AgentCapability
 from models.task import Task, TaskStatus, TaskPriority
@@ -81,124 +83,171 @@ AGENTS = [
 # Create a lookup dictionary for agents by ID
 AGENTS_BY_ID = {agent.id: agent for agent in AGENTS}
 
-# Sample task data
-TASKS = [
-    Task(
-        id="TASK-061A",
-        description="Create Web UI Shell (React + Tailwind)",
-        status=TaskStatus.COMPLETED,
-        agent_id="CC",
-        priority=TaskPriority.HIGH,
-        created_at=NOW - timedelta(days=1, hours=5),
-        updated_at=NOW - timedelta(days=1),
-        start_time=NOW - timedelta(days=1, hours=4),
-        end_time=NOW - timedelta(days=1),
-        retries=0,
-        fallback_agent=None,
-        details=[
-            f"Started at: {(NOW - timedelta(days=1, hours=4)).strftime('%Y-%m-%d %H:%M:%S')}",
+# Case-insensitive lookup: agents keyed by casefolded ID
+AGENTS_BY_ID_CI = {agent_id.casefold(): agent for agent_id, agent in AGENTS_BY_ID.items()}
+
+# Serialized JSON for each agent, keyed like AGENTS_BY_ID_CI
+AGENTS_JSON_BY_ID_CI = {
+    agent_id: orjson.dumps(agent.model_dump(mode="json")) for agent_id, agent in AGENTS_BY_ID_CI.items()
+}
+
+# Agents grouped by lowercase status value, in AGENTS order
+AGENTS_BY_STATUS: Dict[str, List[Agent]] = {}
+for _agent in AGENTS:
+    AGENTS_BY_STATUS.setdefault(_agent.status.value.lower(), []).append(_agent)
+
+
+def _agent_list_json(agents: List[Agent]) -> bytes:
+    return orjson.dumps({"agents": [agent.model_dump(mode="json") for agent in agents], "count": len(agents)})
+
+
+# Serialized /agents responses: all agents, and per lowercase status
+AGENTS_LIST_JSON = _agent_list_json(AGENTS)
+AGENTS_LIST_JSON_BY_STATUS = {status: _agent_list_json(agents) for status, agents in AGENTS_BY_STATUS.items()}
+
+# Sample task data; "steps" are the progress notes between the
+# "Started at" and "Completed at" lines derived from start_time and end_time
+_TASK_DATA = [
+    {
+        "id": "TASK-061A",
+        "description": "Create Web UI Shell (React + Tailwind)",
+        "status": TaskStatus.COMPLETED,
+        "agent_id": "CC",
+        "priority": TaskPriority.HIGH,
+        "created_at": NOW - timedelta(days=1, hours=5),
+        "updated_at": NOW - timedelta(days=1),
+        "start_time": NOW - timedelta(days=1, hours=4),
+        "end_time": NOW - timedelta(days=1),
+        "retries": 0,
+        "fallback_agent": None,
+        "steps": [
             "Set up Vite with React and TypeScript",
-            "Implemented layout and routing",
-            f"Completed at: {(NOW - timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S')}"
+            "Implemented layout and routing"
         ],
-        content={
+        "content": {
             "task_id": "TASK-061A",
             "action": "create",
             "parameters": {"component": "web-ui-shell"}
         }
-    ),
-    Task(
-        id="TASK-061B",
-        description="Create ARCHITECTURE.md documentation",
-        status=TaskStatus.COMPLETED,
-        agent_id="CC",
-        priority=TaskPriority.MEDIUM,
-        created_at=NOW - timedelta(days=1),
-        updated_at=NOW - timedelta(hours=18),
-        start_time=NOW - timedelta(hours=20),
-        end_time=NOW - timedelta(hours=18),
-        retries=0,
-        fallback_agent=None,
-        details=[
-            f"Started at: {(NOW - timedelta(hours=20)).strftime('%Y-%m-%d %H:%M:%S')}",
+    },
+    {
+        "id": "TASK-061B",
+        "description": "Create ARCHITECTURE.md documentation",
+        "status": TaskStatus.COMPLETED,
+        "agent_id": "CC",
+        "priority": TaskPriority.MEDIUM,
+        "created_at": NOW - timedelta(days=1),
+        "updated_at": NOW - timedelta(hours=18),
+        "start_time": NOW - timedelta(hours=20),
+        "end_time": NOW - timedelta(hours=18),
+        "retries": 0,
+        "fallback_agent": None,
+        "steps": [
             "Documented system architecture",
-            "Added component diagrams",
-            f"Completed at: {(NOW - timedelta(hours=18)).strftime('%Y-%m-%d %H:%M:%S')}"
+            "Added component diagrams"
         ],
-        content={
+        "content": {
             "task_id": "TASK-061B",
             "action": "document",
             "parameters": {"file": "ARCHITECTURE.md"}
         }
-    ),
-    Task(
-        id="TASK-061C",
-        description="Implement FastAPI Endpoints",
-        status=TaskStatus.IN_PROGRESS,
-        agent_id="CC",
-        priority=TaskPriority.HIGH,
-        created_at=NOW - timedelta(hours=2),
-        updated_at=NOW - timedelta(hours=1),
-        start_time=NOW - timedelta(hours=1),
-        end_time=None,
-        retries=0,
-        fallback_agent=None,
-        details=[
-            f"Started at: {(NOW - timedelta(hours=1)).strftime('%Y-%m-%d %H:%M:%S')}",
+    },
+    {
+        "id": "TASK-061C",
+        "description": "Implement FastAPI Endpoints",
+        "status": TaskStatus.IN_PROGRESS,
+        "agent_id": "CC",
+        "priority": TaskPriority.HIGH,
+        "created_at": NOW - timedelta(hours=2),
+        "updated_at": NOW - timedelta(hours=1),
+        "start_time": NOW - timedelta(hours=1),
+        "end_time": None,
+        "retries": 0,
+        "fallback_agent": None,
+        "steps": [
             "Creating API project structure",
             "Implementing agent and task endpoints"
         ],
-        content={
+        "content": {
             "task_id": "TASK-061C",
             "action": "implement",
             "parameters": {"component": "fastapi-endpoints"}
         }
-    ),
-    Task(
-        id="TASK-062",
-        description="Add authentication to API endpoints",
-        status=TaskStatus.PENDING,
-        agent_id="CA",
-        priority=TaskPriority.MEDIUM,
-        created_at=NOW - timedelta(hours=1),
-        updated_at=None,
-        start_time=None,
-        end_time=None,
-        retries=0,
-        fallback_agent=None,
-        details=[],
-        content={
+    },
+    {
+        "id": "TASK-062",
+        "description": "Add authentication to API endpoints",
+        "status": TaskStatus.PENDING,
+        "agent_id": "CA",
+        "priority": TaskPriority.MEDIUM,
+        "created_at": NOW - timedelta(hours=1),
+        "updated_at": None,
+        "start_time": None,
+        "end_time": None,
+        "retries": 0,
+        "fallback_agent": None,
+        "steps": [],
+        "content": {
             "task_id": "TASK-062",
             "action": "implement",
             "parameters": {"component": "api-auth"}
         }
-    ),
-    Task(
-        id="TASK-052",
-        description="Dashboard task filtering fixes",
-        status=TaskStatus.COMPLETED,
-        agent_id="WA",
-        priority=TaskPriority.HIGH,
-        created_at=NOW - timedelta(days=3),
-        updated_at=NOW - timedelta(days=2),
-        start_time=NOW - timedelta(days=3),
-        end_time=NOW - timedelta(days=2),
-        retries=2,
-        fallback_agent=None,
-        details=[
-            f"Started at: {(NOW - timedelta(days=3)).strftime('%Y-%m-%d %H:%M:%S')}",
+    },
+    {
+        "id": "TASK-052",
+        "description": "Dashboard task filtering fixes",
+        "status": TaskStatus.COMPLETED,
+        "agent_id": "WA",
+        "priority": TaskPriority.HIGH,
+        "created_at": NOW - timedelta(days=3),
+        "updated_at": NOW - timedelta(days=2),
+        "start_time": NOW - timedelta(days=3),
+        "end_time": NOW - timedelta(days=2),
+        "retries": 2,
+        "fallback_agent": None,
+        "steps": [
             "First attempt failed",
             "Second attempt failed",
-            "Fixed timezone issues in task filtering",
-            f"Completed at: {(NOW - timedelta(days=2)).strftime('%Y-%m-%d %H:%M:%S')}"
+            "Fixed timezone issues in task filtering"
         ],
-        content={
+        "content": {
             "task_id": "TASK-052",
             "action": "fix",
             "parameters": {"component": "dashboard-filtering"}
         }
-    )
+    }
 ]
 
+
+def _build_task(data: Dict[str, Any]) -> Task:
+    """Validate a sample task, framing its steps with its start and end times."""
+    data = dict(data)
+    details = list(data.pop("steps"))
+    if data["start_time"]:
+        details = [f"Started at: {data['start_time']:%Y-%m-%d %H:%M:%S}", *details]
+    if data["end_time"]:
+        details.append(f"Completed at: {data['end_time']:%Y-%m-%d %H:%M:%S}")
+    data["details"] = details
+    return Task.model_validate(data)
+
+
+TASKS = [_build_task(data) for data in _TASK_DATA]
+
 # Create a lookup dictionary for tasks by ID
-TASKS_BY_ID = {task.id: task for task in TASKS}
\ No newline at end of file
+TASKS_BY_ID = {task.id: task for task in TASKS}
+
+# JSON-ready dict and serialized JSON for each task, keyed by ID
+TASK_DICTS_BY_ID = {task_id: task.model_dump(mode="json") for task_id, task in TASKS_BY_ID.items()}
+TASKS_JSON_BY_ID = {task_id: orjson.dumps(task_dict) for task_id, task_dict in TASK_DICTS_BY_ID.items()}
+
+# Tasks ordered newest first by updated_at (or created_at), and the same order
+# grouped by lowercase status, casefolded agent ID, and both
+TASKS_SORTED = sorted(TASKS, key=lambda t: t.updated_at or t.created_at, reverse=True)
+TASKS_BY_STATUS: Dict[str, List[Task]] = {}
+TASKS_BY_AGENT: Dict[str, List[Task]] = {}
+TASKS_BY_STATUS_AND_AGENT: Dict[Tuple[str, str], List[Task]] = {}
+for _task in TASKS_SORTED:
+    _status, _agent_id = _task.status.value.lower(), _task.agent_id.casefold()
+    TASKS_BY_STATUS.setdefault(_status, []).append(_task)
+    TASKS_BY_AGENT.setdefault(_agent_id, []).append(_task)
+    TASKS_BY_STATUS_AND_AGENT.setdefault((_status, _agent_id), []).append(_task)
@@ -0,0 +1,88 @@
+"""
+Cache of parsed JSON files and directory listings shared by the API services.
+"""
+import os
+from typing import Any, Dict, List, Tuple, Union
+
+import orjson
+
+# Parsed file contents keyed by path, with the (mtime_ns, size) they were read at
+_FILE_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+# Entry names keyed by directory, with the mtime_ns they were listed at
+_DIR_CACHE: Dict[str, Tuple[int, List[str]]] = {}
+
+
+def file_signature(path: Union[str, os.PathLike]) -> Tuple[int, int]:
+    """
+    Identify the current version of a file.
+    
+    Args:
+        path: File to stat
+        
+    Returns:
+        Tuple[int, int]: Modification time in nanoseconds and size in bytes
+        
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_json_cached(path: Union[str, os.PathLike]) -> Any:
+    """
+    Parse a JSON file, reusing the previous result while the file is unchanged.
+    
+    The returned object is shared between callers and must not be modified.
+    
+    Args:
+        path: JSON file to load
+        
+    Returns:
+        Any: The parsed file contents
+        
+    Raises:
+        FileNotFoundError: If the file does not exist
+        orjson.JSONDecodeError: If the file is not valid JSON (a json.JSONDecodeError)
+    """
+    key = os.fspath(path)
+    signature = file_signature(key)
+    cached = _FILE_CACHE.get(key)
+    if cached and cached[0] == signature:
+        return cached[1]
+    
+    # Read the whole file in one call and parse the bytes with orjson
+    with open(key, 'rb') as f:
+        data = orjson.loads(f.read())
+    _FILE_CACHE[key] = (signature, data)
+    return data
+
+
+def list_dir_cached(path: Union[str, os.PathLike]) -> List[str]:
+    """
+    List the names in a directory, reusing the previous listing while the
+    directory is unchanged.
+    
+    Hidden entries are left out, as glob() does. The returned list is shared
+    between callers and must not be modified.
+    
+    Args:
+        path: Directory to list
+        
+    Returns:
+        List[str]: Entry names in the directory
+        
+    Raises:
+        FileNotFoundError: If the directory does not exist
+    """
+    key = os.fspath(path)
+    mtime_ns = os.stat(key).st_mtime_ns
+    cached = _DIR_CACHE.get(key)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+    
+    with os.scandir(key) as entries:
+        names = [entry.name for entry in entries if not entry.name.startswith('.')]
+    _DIR_CACHE[key] = (mtime_ns, names)
+    return names
@@ -1,14 +1,19 @@
 """
 Service for handling task and plan history data.
+
+Only the dummy history is built with model_construct(); items read from logs,
+outboxes and plan files are validated, as those files are edited by hand.
 """
-import json
 import os
-import glob
+import heapq
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from operator import itemgetter
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
 from models.history import PlanHistoryItem, TaskRecentItem
+from services.file_cache import list_dir_cached, load_json_cached
+from services.timestamps import parse_iso
 
 
 class HistoryService:
@@ -34,17 +39,21 @@ class HistoryService:
         
         # Try to read from plan logs and execution history
         try:
-            # Look for plan files in plans directory
-            plan_files = list(self.plans_path.glob("*.yaml")) if self.plans_path.exists() else []
+            # Look for plan files in plans directory, and for plan execution logs
+            yaml_files = self._stat_files(self.plans_path, lambda name: name.endswith(".yaml"))
+            json_files = self._stat_files(self.logs_path, lambda name: "plan" in name and name.endswith(".json"))
             
-            # Also check for plan execution logs
-            if self.logs_path.exists():
-                log_files = list(self.logs_path.glob("*plan*.json"))
-                plan_files.extend(log_files)
+            # Only the `limit` most recently written files are read, rather
+            # than the first `limit` in directory order
+            candidates = [(mtime, plan_file, True) for mtime, plan_file in yaml_files]
+            candidates.extend((mtime, plan_file, False) for mtime, plan_file in json_files)
             
-            for plan_file in plan_files[:limit]:
+            for mtime, plan_file, is_yaml in heapq.nlargest(limit, candidates, key=itemgetter(0)):
                 try:
-                    plan_item = self._extract_plan_history_from_file(plan_file)
+                    if is_yaml:
+                        plan_item = self._plan_history_from_yaml(plan_file, mtime)
+                    else:
+                        plan_item = self._plan_history_from_json(plan_file)
                     if plan_item:
                         plan_history.append(plan_item)
                 except Exception:
@@ -56,8 +65,9 @@ class HistoryService:
         if not plan_history:
             plan_history = self._get_dummy_plan_history(limit)
         
-        # Sort by submission time (newest first)
-        plan_history.sort(key=lambda x: x.submitted_at, reverse=True)
+        # Sort by submission time (newest first); by epoch seconds, as plan
+        # files give naive times and execution logs may give UTC ones
+        plan_history.sort(key=lambda x: x.submitted_at.timestamp(), reverse=True)
         
         return plan_history[:limit]
     
@@ -73,21 +83,38 @@ class HistoryService:
             List[TaskRecentItem]: List of recent task items
         """
         recent_tasks = []
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+        # Compared as epoch seconds, which works for both naive (local) and
+        # UTC ("Z") timestamps; comparing the datetimes raises for the mix
+        cutoff_ts = (datetime.now() - timedelta(hours=hours)).timestamp()
         
         try:
             # Read from agent scores log
             scores_file = self.logs_path / "agent_scores.json"
             if scores_file.exists():
-                with open(scores_file, 'r') as f:
-                    scores_data = json.load(f)
-                    
+                scores_data = load_json_cached(scores_file)
+                
                 # If it's a flat array format, extract tasks
                 if isinstance(scores_data, list):
-                    for entry in scores_data:
+                    # Only the newest `limit` valid entries in the window can
+                    # make the result, so build items newest first and stop
+                    # once there are enough
+                    in_window = []
+                    for index, entry in enumerate(scores_data):
+                        try:
+                            entry_ts = parse_iso(entry["timestamp"]).timestamp()
+                        except Exception:
+                            continue
+                        if entry_ts >= cutoff_ts:
+                            in_window.append((-entry_ts, index, entry))
+                    heapq.heapify(in_window)
+                    
+                    log_tasks = 0
+                    while in_window and log_tasks < limit:
+                        _, _, entry = heapq.heappop(in_window)
                         task_item = self._extract_task_from_log_entry(entry)
-                        if task_item and task_item.timestamp >= cutoff_time:
+                        if task_item:
                             recent_tasks.append(task_item)
+                            log_tasks += 1
                 # If it's the summary format, create synthetic entries
                 elif isinstance(scores_data, dict):
                     for agent_id, data in scores_data.items():
@@ -96,13 +123,15 @@ class HistoryService:
                             recent_tasks.append(task_item)
             
             # Also check postbox outboxes for recent task status messages
-            if self.postbox_path.exists():
-                for agent_dir in self.postbox_path.iterdir():
-                    if agent_dir.is_dir():
-                        outbox_file = agent_dir / "outbox.json"
-                        if outbox_file.exists():
-                            tasks_from_outbox = self._extract_tasks_from_outbox(outbox_file, cutoff_time)
-                            recent_tasks.extend(tasks_from_outbox)
+            for outbox_file in self._list_outboxes():
+                try:
+                    # An outbox last written before the cutoff holds no recent messages
+                    if os.stat(outbox_file).st_mtime < cutoff_ts:
+                        continue
+                except OSError:
+                    continue
+                tasks_from_outbox = self._extract_tasks_from_outbox(Path(outbox_file), cutoff_ts)
+                recent_tasks.extend(tasks_from_outbox)
         except Exception:
             pass
         
@@ -110,39 +139,67 @@ class HistoryService:
         if not recent_tasks:
             recent_tasks = self._get_dummy_recent_tasks(limit, hours)
         
-        # Sort by timestamp (newest first) and limit
-        recent_tasks.sort(key=lambda x: x.timestamp, reverse=True)
+        # Sort by timestamp (newest first) and limit; by epoch seconds, as
+        # the items may mix naive and UTC timestamps
+        recent_tasks.sort(key=lambda x: x.timestamp.timestamp(), reverse=True)
         
         return recent_tasks[:limit]
     
-    def _extract_plan_history_from_file(self, plan_file: Path) -> Optional[PlanHistoryItem]:
-        """Extract plan history from plan file or log."""
+    def _stat_files(self, directory: Path, match: Callable[[str], bool]) -> List[Tuple[float, Path]]:
+        """List the files in a directory whose names pass `match`, with their mtimes."""
         try:
-            if plan_file.suffix == '.yaml':
-                # This is a plan definition file
-                plan_id = plan_file.stem
-                stat = plan_file.stat()
-                return PlanHistoryItem(
-                    plan_id=plan_id,
-                    submitted_at=datetime.fromtimestamp(stat.st_mtime),
-                    agent_count=3,  # Default estimate
-                    status="submitted",
-                    duration_sec=None,
-                    success_rate=None
-                )
-            elif plan_file.suffix == '.json':
-                # This might be an execution log
-                with open(plan_file, 'r') as f:
-                    log_data = json.load(f)
-                
-                return PlanHistoryItem(
-                    plan_id=log_data.get("plan_id", plan_file.stem),
-                    submitted_at=datetime.fromisoformat(log_data.get("start_time", datetime.now().isoformat()).replace('Z', '+00:00')),
-                    agent_count=log_data.get("agent_count", 3),
-                    status=log_data.get("status", "complete"),
-                    duration_sec=log_data.get("duration_sec"),
-                    success_rate=log_data.get("success_rate")
-                )
+            names = list_dir_cached(directory)
+        except FileNotFoundError:
+            return []
+        
+        files = []
+        for name in names:
+            if match(name):
+                plan_file = directory / name
+                try:
+                    files.append((plan_file.stat().st_mtime, plan_file))
+                except OSError:
+                    continue
+        return files
+    
+    def _list_outboxes(self) -> List[str]:
+        """List the outbox paths of the agent directories in the postbox."""
+        try:
+            # Directory entries already know whether they are directories, so
+            # only the outboxes themselves need a stat
+            with os.scandir(self.postbox_path) as entries:
+                return [
+                    os.path.join(entry.path, "outbox.json")
+                    for entry in entries
+                    if not entry.name.startswith('.') and entry.is_dir()
+                ]
+        except FileNotFoundError:
+            return []
+    
+    def _plan_history_from_yaml(self, plan_file: Path, mtime: float) -> PlanHistoryItem:
+        """Build plan history for a plan definition file from its mtime alone."""
+        return PlanHistoryItem(
+            plan_id=plan_file.stem,
+            submitted_at=datetime.fromtimestamp(mtime),
+            agent_count=3,  # Default estimate
+            status="submitted",
+            duration_sec=None,
+            success_rate=None
+        )
+    
+    def _plan_history_from_json(self, plan_file: Path) -> Optional[PlanHistoryItem]:
+        """Extract plan history from a plan execution log."""
+        try:
+            log_data = load_json_cached(plan_file)
+            
+            return PlanHistoryItem(
+                plan_id=log_data.get("plan_id", plan_file.stem),
+                submitted_at=parse_iso(log_data.get("start_time", datetime.now().isoformat())),
+                agent_count=log_data.get("agent_count", 3),
+                status=log_data.get("status", "complete"),
+                duration_sec=log_data.get("duration_sec"),
+                success_rate=log_data.get("success_rate")
+            )
         except Exception:
             return None
     
@@ -157,7 +214,7 @@ class HistoryService:
                 retry_count=entry.get("retry_count", 0),
                 duration_sec=entry.get("duration_sec"),
                 task_id=entry.get("task_id"),
-                timestamp=datetime.fromisoformat(entry["timestamp"].replace('Z', '+00:00')),
+                timestamp=parse_iso(entry["timestamp"]),
                 error_code=entry.get("error_code")
             )
         except Exception:
@@ -168,7 +225,7 @@ class HistoryService:
         try:
             last_activity = data.get("last_activity")
             if last_activity:
-                timestamp = datetime.fromisoformat(last_activity.replace('Z', '+00:00'))
+                timestamp = parse_iso(last_activity)
             else:
                 timestamp = datetime.now()
             
@@ -186,18 +243,17 @@ class HistoryService:
         except Exception:
             return None
     
-    def _extract_tasks_from_outbox(self, outbox_file: Path, cutoff_time: datetime) -> List[TaskRecentItem]:
+    def _extract_tasks_from_outbox(self, outbox_file: Path, cutoff_ts: float) -> List[TaskRecentItem]:
         """Extract task information from agent outbox messages."""
         tasks = []
         try:
-            with open(outbox_file, 'r') as f:
-                outbox_data = json.load(f)
+            outbox_data = load_json_cached(outbox_file)
             
             if isinstance(outbox_data, list):
                 for message in outbox_data:
                     try:
-                        msg_time = datetime.fromisoformat(message.get("timestamp", "").replace('Z', '+00:00'))
-                        if msg_time >= cutoff_time:
+                        msg_time = parse_iso(message.get("timestamp", ""))
+                        if msg_time.timestamp() >= cutoff_ts:
                             # Extract task info from message
                             content = message.get("content", {})
                             if "task_id" in content:
@@ -226,7 +282,7 @@ class HistoryService:
         base_time = datetime.now()
         
         for i in range(min(limit, 10)):
-            dummy_plans.append(PlanHistoryItem(
+            dummy_plans.append(PlanHistoryItem.model_construct(
                 plan_id=f"test-plan-{i+1:03d}",
                 submitted_at=base_time - timedelta(hours=i*2, minutes=i*15),
                 agent_count=3 + (i % 3),
@@ -247,7 +303,7 @@ class HistoryService:
             agent = agents[i % len(agents)]
             success = i % 4 != 3  # 75% success rate
             
-            dummy_tasks.append(TaskRecentItem(
+            dummy_tasks.append(TaskRecentItem.model_construct(
                 trace_id=f"trace-{i+1:04d}-{agent.lower()}",
                 agent=agent,
                 score=0.91 - (i * 0.02) if success else 0.3 + (i * 0.01),
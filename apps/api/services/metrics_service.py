@@ -1,13 +1,17 @@
 """
 Service for handling metrics data aggregation and processing.
+
+Only the dummy agent metrics are built with model_construct(); metrics read
+from the score and plan logs are validated, as those files are edited by hand.
 """
 import json
 import os
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-import glob
 
 from models.metrics import AgentMetrics, PlanMetrics
+from services.file_cache import list_dir_cached, load_json_cached
+from services.timestamps import parse_iso
 
 
 class MetricsService:
@@ -31,16 +35,14 @@ class MetricsService:
         scores_file = os.path.join(self.logs_path, "agent_scores.json")
         if os.path.exists(scores_file):
             try:
-                with open(scores_file, 'r') as f:
-                    scores_data = json.load(f)
-                    
+                scores_data = load_json_cached(scores_file)
                 for agent_id, data in scores_data.items():
                     agent_metrics.append(AgentMetrics(
                         agent_id=agent_id,
                         average_score=data.get("average_score", 0.85),
                         success_rate=data.get("success_rate", 0.80),
                         task_count=data.get("task_count", 10),
-                        last_activity=datetime.fromisoformat(data["last_activity"].replace('Z', '+00:00')) if "last_activity" in data else None
+                        last_activity=parse_iso(data["last_activity"]) if "last_activity" in data else None
                     ))
             except (json.JSONDecodeError, FileNotFoundError, KeyError):
                 pass
@@ -62,14 +64,19 @@ class MetricsService:
             Optional[PlanMetrics]: Plan metrics if found, None otherwise
         """
         # Try to read from plan execution logs
-        plan_log_pattern = os.path.join(self.logs_path, f"*{plan_id}*.json")
-        plan_files = glob.glob(plan_log_pattern)
+        try:
+            plan_files = [
+                os.path.join(self.logs_path, name)
+                for name in list_dir_cached(self.logs_path)
+                if plan_id in name and name.endswith(".json")
+            ]
+        except FileNotFoundError:
+            plan_files = []
         
         if plan_files:
             try:
-                with open(plan_files[0], 'r') as f:
-                    plan_data = json.load(f)
-                    
+                plan_data = load_json_cached(plan_files[0])
+                
                 # Extract agent metrics from plan execution
                 agent_metrics = self._extract_agent_metrics_from_plan(plan_data)
                 
@@ -80,8 +87,8 @@ class MetricsService:
                     total_tasks=plan_data.get("total_tasks", len(agent_metrics)),
                     completed_tasks=plan_data.get("completed_tasks", len(agent_metrics)),
                     success_rate=plan_data.get("success_rate", 0.85),
-                    execution_start=datetime.fromisoformat(plan_data["execution_start"].replace('Z', '+00:00')) if "execution_start" in plan_data else None,
-                    execution_end=datetime.fromisoformat(plan_data["execution_end"].replace('Z', '+00:00')) if "execution_end" in plan_data else None,
+                    execution_start=parse_iso(plan_data["execution_start"]) if "execution_start" in plan_data else None,
+                    execution_end=parse_iso(plan_data["execution_end"]) if "execution_end" in plan_data else None,
                     status=plan_data.get("status", "completed")
                 )
             except (json.JSONDecodeError, FileNotFoundError, KeyError):
@@ -93,28 +100,28 @@ class MetricsService:
     def _get_dummy_agent_metrics(self) -> List[AgentMetrics]:
         """Generate dummy agent metrics for testing."""
         return [
-            AgentMetrics(
+            AgentMetrics.model_construct(
                 agent_id="CA",
                 average_score=0.91,
                 success_rate=0.87,
                 task_count=27,
                 last_activity=datetime.now()
             ),
-            AgentMetrics(
+            AgentMetrics.model_construct(
                 agent_id="CC",
                 average_score=0.88,
                 success_rate=0.83,
                 task_count=23,
                 last_activity=datetime.now()
             ),
-            AgentMetrics(
+            AgentMetrics.model_construct(
                 agent_id="WA",
                 average_score=0.85,
                 success_rate=0.81,
                 task_count=19,
                 last_activity=datetime.now()
             ),
-            AgentMetrics(
+            AgentMetrics.model_construct(
                 agent_id="ARCH",
                 average_score=0.94,
                 success_rate=0.92,
@@ -150,7 +157,7 @@ class MetricsService:
                 average_score=data.get("score", 0.85),
                 success_rate=data.get("success_rate", 0.80),
                 task_count=data.get("task_count", 1),
-                last_activity=datetime.fromisoformat(data["last_activity"].replace('Z', '+00:00')) if "last_activity" in data else None
+                last_activity=parse_iso(data["last_activity"]) if "last_activity" in data else None
             ))
         
         return agent_metrics
\ No newline at end of file
@@ -1,12 +1,33 @@
-from datetime import datetime
-import json
+import asyncio
+from collections import OrderedDict
+from datetime import datetime, timezone
 import uuid
+import orjson
 import yaml
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import Dict, List, NamedTuple, Optional, Any, Tuple, Union
 
 from models.plan import ExecutionPlan, PlanResponse
 
+try:
+    # libyaml-backed loader and dumper, when PyYAML was built with them
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
+# Plans kept in memory; the least recently used are dropped beyond this
+MAX_STORED_PLANS = 10_000
+
+
+class PlanRecord(NamedTuple):
+    """A submitted plan and its execution status."""
+    plan: ExecutionPlan
+    status: str
+    created_at: datetime
+    file_path: str
+    execution_id: Optional[str] = None
+
+
 class PlanService:
     """Service for handling execution plans."""
     
@@ -15,8 +36,12 @@ class PlanService:
         self.plans_dir = Path("plans")
         self.plans_dir.mkdir(exist_ok=True)
         
-        # In-memory storage for plans and their execution status
-        self._plans: Dict[str, Dict[str, Any]] = {}
+        # In-memory storage for plans and their execution status, in least
+        # recently used order
+        self._plans: "OrderedDict[str, PlanRecord]" = OrderedDict()
+        
+        # list_plans() entries for the stored plans, in submission order
+        self._plan_summaries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
     
     async def validate_plan(self, plan_data: Union[Dict[str, Any], str]) -> Tuple[bool, Optional[ExecutionPlan], List[Dict[str, Any]]]:
         """Validate a plan against the schema.
@@ -37,10 +62,10 @@ class PlanService:
             try:
                 if plan_data.strip().startswith('{'):
                     # Assume JSON
-                    plan_dict = json.loads(plan_data)
+                    plan_dict = orjson.loads(plan_data)
                 else:
                     # Assume YAML
-                    plan_dict = yaml.safe_load(plan_data)
+                    plan_dict = yaml.load(plan_data, Loader=YamlLoader)
             except Exception as e:
                 errors.append({"loc": ["plan"], "msg": f"Failed to parse plan data: {str(e)}"})
                 return False, None, errors
@@ -66,15 +91,26 @@ class PlanService:
         """
         # Ensure plan ID is unique
         plan_id = plan.metadata.plan_id
-        file_name = f"{plan_id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.yaml"
+        file_name = f"{plan_id}_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.yaml"
         file_path = self.plans_dir / file_name
         
-        # Convert to dict and save as YAML
-        with open(file_path, 'w') as f:
-            yaml.dump(plan.dict(), f, default_flow_style=False)
+        # Write from a worker thread so the event loop isn't blocked on disk
+        await asyncio.to_thread(self._save_plan_sync, plan, file_path)
         
         return str(file_path)
     
+    def _save_plan_sync(self, plan: ExecutionPlan, file_path: Path) -> None:
+        """Write a plan to disk as YAML.
+        
+        Args:
+            plan: Validated execution plan
+            file_path: File to write the plan to
+        """
+        # Convert to dict and save as YAML; timestamps are written as ISO 8601
+        # strings, as they appear in hand-written plans
+        with open(file_path, 'w') as f:
+            yaml.dump(plan.model_dump(mode="json"), f, Dumper=YamlDumper, default_flow_style=False)
+    
     async def submit_plan(self, plan_data: Union[Dict[str, Any], str], execute: bool = False) -> PlanResponse:
         """Submit a new execution plan.
         
@@ -99,14 +135,13 @@ class PlanService:
         # Save plan to disk
         plan_path = await self.save_plan(validated_plan)
         
-        # Store plan in memory
         plan_id = validated_plan.metadata.plan_id
-        self._plans[plan_id] = {
-            "plan": validated_plan,
-            "status": "validated",
-            "created_at": datetime.utcnow(),
-            "file_path": plan_path
-        }
+        record = PlanRecord(
+            plan=validated_plan,
+            status="validated",
+            created_at=datetime.now(timezone.utc),
+            file_path=plan_path
+        )
         
         # Handle execution if requested
         execution_id = None
@@ -122,12 +157,14 @@ class PlanService:
             # process here, either synchronously or asynchronously
             if self._should_mock_execution():
                 # This is a placeholder for real execution logic
-                self._plans[plan_id]["status"] = "processing"
-                self._plans[plan_id]["execution_id"] = execution_id
+                record = record._replace(status="processing", execution_id=execution_id)
                 
                 # In a real implementation, this would start a background task
                 # that runs the plan using arch_orchestrator.py
         
+        # Store plan in memory
+        self._store_plan(plan_id, record)
+        
         return PlanResponse(
             plan_id=plan_id,
             status=status,
@@ -144,24 +181,53 @@ class PlanService:
         Returns:
             Optional[Dict[str, Any]]: Plan status information or None if not found
         """
-        return self._plans.get(plan_id)
+        record = self._plans.get(plan_id)
+        if record is None:
+            return None
+        
+        self._plans.move_to_end(plan_id)
+        status = record._asdict()
+        # Only plans that were executed have an execution ID
+        if record.execution_id is None:
+            del status["execution_id"]
+        return status
     
-    async def list_plans(self) -> List[Dict[str, Any]]:
-        """List all plans.
+    async def list_plans(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List all plans, optionally only those with a given status.
         
+        Args:
+            status: Only include plans with this status
+            
         Returns:
             List[Dict[str, Any]]: List of plans with their metadata
         """
-        return [
-            {
-                "plan_id": plan_id,
-                "status": plan_info["status"],
-                "created_at": plan_info["created_at"].isoformat(),
-                "description": plan_info["plan"].metadata.description,
-                "task_count": len(plan_info["plan"].tasks)
-            }
-            for plan_id, plan_info in self._plans.items()
-        ]
+        if not status:
+            return list(self._plan_summaries.values())
+        return [summary for summary in self._plan_summaries.values() if summary["status"] == status]
+    
+    def _store_plan(self, plan_id: str, record: PlanRecord) -> None:
+        """Store a plan and its summary, dropping the least recently used beyond the cap.
+        
+        Args:
+            plan_id: The ID of the plan
+            record: The plan and its execution status
+        """
+        self._plans[plan_id] = record
+        self._plans.move_to_end(plan_id)
+        
+        # Keep the list_plans() entry alongside, so listing doesn't rebuild it
+        self._plan_summaries[plan_id] = {
+            "plan_id": plan_id,
+            "status": record.status,
+            "created_at": record.created_at.isoformat(),
+            "description": record.plan.metadata.description,
+            "task_count": len(record.plan.tasks)
+        }
+        self._plan_summaries.move_to_end(plan_id)
+        
+        while len(self._plans) > MAX_STORED_PLANS:
+            evicted_id, _ = self._plans.popitem(last=False)
+            del self._plan_summaries[evicted_id]
     
     def _should_mock_execution(self) -> bool:
         """Determine if we should mock execution for development.
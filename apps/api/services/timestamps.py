@@ -0,0 +1,22 @@
+"""
+Timestamp parsing shared by the API services.
+"""
+from datetime import datetime
+
+
+def parse_iso(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp, accepting a trailing "Z" for UTC.
+    
+    Args:
+        value: Timestamp such as "2025-05-21T09:30:00Z"
+        
+    Returns:
+        datetime: The parsed timestamp
+        
+    Raises:
+        ValueError: If the value is not an ISO 8601 timestamp
+    """
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
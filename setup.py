@@ -16,6 +16,7 @@ setup(
     include_package_data=True,
     install_requires=[
         "pydantic>=2.0.0",
+        "orjson>=3.8.0",
         "pyyaml>=6.0",
     ],
     entry_points={
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Tests for the agent runner dependency handling.
+"""
+
+import unittest
+import os
+import json
+import tempfile
+import shutil
+from pathlib import Path
+from unittest import mock
+
+# Add the parent directory to the path so we can import our modules
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import agent_runner
+
+
+TASK_LOG = """# Task Log - CA
+
+
+## 2025-05-18T00:49:10.756470
+**Status**: ✅ Success
+**Message ID**: m1
+**From**: ARCH
+**Type**: task_assignment
+**Task ID**: TASK-010
+**Details**: Data processed successfully
+
+## 2025-05-18T00:50:10.756470
+**Status**: ❌ Failed
+**Message ID**: m2
+**From**: ARCH
+**Type**: task_assignment
+**Task ID**: TASK-011
+**Details**: Validation error
+
+## 2025-05-18T00:51:10.756470
+**Status**: ✅ Success
+**Message ID**: m3
+**From**: CC
+**Type**: task_status
+**Details**: Status acknowledged
+"""
+
+
+class TestDependencyIndex(unittest.TestCase):
+    """Test cases for the completed-task index used by dependency checks."""
+
+    def setUp(self):
+        """Set up a temporary postbox and switch into it."""
+        self.test_dir = tempfile.mkdtemp()
+        self.original_cwd = os.getcwd()
+        os.chdir(self.test_dir)
+
+        for agent in ("CA", "CC"):
+            Path(f"postbox/{agent}").mkdir(parents=True)
+
+        outbox = [
+            {"type": "task_status", "id": "s1", "content": {"task_id": "TASK-001", "status": "completed"}},
+            {"type": "task_status", "id": "s2", "content": {"task_id": "TASK-002", "status": "failed"}},
+            {"type": "task_assignment", "id": "a1", "content": {"task_id": "TASK-003"}}
+        ]
+        with open("postbox/CC/outbox.json", "w") as f:
+            json.dump(outbox, f, indent=2)
+
+        with open("postbox/CA/task_log.md", "w") as f:
+            f.write(TASK_LOG)
+
+    def tearDown(self):
+        """Clean up test environment."""
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.test_dir)
+
+    def test_index_contains_only_completed_tasks(self):
+        """Only task_status messages with a completed status are indexed."""
+        completed = agent_runner.build_completed_index()
+        self.assertIn("TASK-001", completed)
+        self.assertNotIn("TASK-002", completed)
+        self.assertNotIn("TASK-003", completed)
+
+    def test_task_log_entries_are_parsed_individually(self):
+        """A failed entry is not credited with a later entry's success."""
+        completed = agent_runner.completed_from_task_log(TASK_LOG.encode())
+        self.assertEqual(completed, {"TASK-010"})
+        self.assertIn("TASK-010", agent_runner.build_completed_index())
+
+    def test_index_reads_both_task_logs(self):
+        """Completions appended to the markdown log count once a JSONL log exists."""
+        log_path = Path("postbox/CA/task_log.md")
+        log_buffer = []
+        message = {"type": "task_assignment", "id": "m4", "sender": "ARCH", "content": {"task_id": "TASK-012"}}
+        agent_runner.append_to_task_log(log_buffer, message, True, "done")
+        agent_runner.flush_task_log(log_path, "CA", log_buffer)
+
+        records = agent_runner.completed_from_task_records("postbox/CA/task_log.jsonl")
+        self.assertEqual(records, {"TASK-012"})
+        self.assertIn("**Task ID**: TASK-012", log_path.read_text())
+
+        # Another tool appends a completion to the markdown log only
+        with open(log_path, "a") as f:
+            f.write("\n## 2025-05-18T01:00:00\n**Status**: ✅ Success\n**Task ID**: TASK-099\n")
+        completed = agent_runner.build_completed_index()
+        self.assertTrue({"TASK-010", "TASK-012", "TASK-099"} <= completed)
+
+    def test_check_dependencies_met(self):
+        """Missing dependencies are reported in declaration order."""
+        completed = agent_runner.build_completed_index()
+        message = {"metadata": {"depends_on": ["TASK-001", "TASK-002", "TASK-003"]}}
+
+        met, missing = agent_runner.check_dependencies_met(message, completed)
+        self.assertFalse(met)
+        self.assertEqual(missing, ["TASK-002", "TASK-003"])
+
+        met, missing = agent_runner.check_dependencies_met({"metadata": {}}, completed)
+        self.assertTrue(met)
+        self.assertEqual(missing, [])
+
+
+class TestValidateMessage(unittest.TestCase):
+    """Test cases for message validation against the exchange protocol."""
+
+    def setUp(self):
+        """Build a validator for a minimal protocol schema."""
+        self.validator = agent_runner.build_validator({
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "type": "object",
+            "required": ["type", "id", "content"],
+            "properties": {"type": {"enum": ["task_assignment", "task_status", "error"]}}
+        })
+
+    def test_missing_required_field(self):
+        """A missing top-level field is reported without a full schema walk."""
+        valid, error = agent_runner.validate_message({"type": "error", "id": "m1"}, self.validator)
+        self.assertFalse(valid)
+        self.assertEqual(error, "'content' is a required property")
+
+    def test_schema_errors_are_reported(self):
+        """Messages with all fields present still get full schema validation."""
+        message = {"type": "task_status", "id": "m1", "content": {}}
+        self.assertEqual(agent_runner.validate_message(message, self.validator), (True, None))
+
+        message["type"] = "unknown"
+        valid, error = agent_runner.validate_message(message, self.validator)
+        self.assertFalse(valid)
+        self.assertIn("'unknown' is not one of", error)
+
+
+class TestProcessInbox(unittest.TestCase):
+    """Test cases for dependency-ordered inbox processing."""
+
+    def setUp(self):
+        """Set up a temporary postbox and switch into it."""
+        self.test_dir = tempfile.mkdtemp()
+        self.original_cwd = os.getcwd()
+        os.chdir(self.test_dir)
+        Path("postbox/CA").mkdir(parents=True)
+        self.validator = agent_runner.build_validator({"type": "object"})
+
+    def tearDown(self):
+        """Clean up test environment."""
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.test_dir)
+
+    def _task(self, message_id, task_id, depends_on=()):
+        return {
+            "type": "task_assignment",
+            "id": message_id,
+            "sender": "ARCH",
+            "content": {"task_id": task_id, "type": "data_processing"},
+            "metadata": {"depends_on": list(depends_on)}
+        }
+
+    def test_dependencies_later_in_inbox_are_run_first(self):
+        """A task waits for a dependency that appears later in the same inbox."""
+        inbox = [
+            self._task("m1", "TASK-002", ["TASK-001"]),
+            self._task("m2", "TASK-001"),
+            self._task("m3", "TASK-003", ["TASK-404"])
+        ]
+        with open("postbox/CA/inbox.json", "w") as f:
+            json.dump(inbox, f)
+
+        agent_runner.process_inbox("CA", self.validator, clear=True, context_dir="context", quiet=True)
+
+        with open("postbox/CA/outbox.json") as f:
+            outbox = json.load(f)
+        self.assertEqual([m["metadata"]["original_message_id"] for m in outbox], ["m2", "m1"])
+
+        with open("postbox/CA/inbox.json") as f:
+            self.assertEqual([m["id"] for m in json.load(f)], ["m3"])
+
+
+class TestAppendToJsonArray(unittest.TestCase):
+    """Test cases for appending status messages to an outbox file."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = tempfile.mkdtemp()
+        self.outbox_path = Path(self.test_dir) / "outbox.json"
+
+    def tearDown(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.test_dir)
+
+    def test_append_matches_full_rewrite(self):
+        """Appending produces the same bytes as save_json_file for the whole list."""
+        existing = [{"id": "a", "content": {"task_id": "TASK-001"}}]
+        new = [{"id": "b", "content": {}}, {"id": "c", "content": {"details": "déjà vu ✓"}}]
+        agent_runner.save_json_file(self.outbox_path, existing)
+
+        agent_runner.append_to_json_array(self.outbox_path, new)
+
+        expected = Path(self.test_dir) / "expected.json"
+        agent_runner.save_json_file(expected, existing + new)
+        self.assertEqual(self.outbox_path.read_bytes(), expected.read_bytes())
+
+    def test_append_to_empty_or_missing_file(self):
+        """An empty array or a missing file gets a fresh array."""
+        agent_runner.append_to_json_array(self.outbox_path, [{"id": "a"}])
+        self.assertEqual(json.loads(self.outbox_path.read_text()), [{"id": "a"}])
+
+        self.outbox_path.write_text("[]\n")
+        agent_runner.append_to_json_array(self.outbox_path, [{"id": "b"}])
+        self.assertEqual(json.loads(self.outbox_path.read_text()), [{"id": "b"}])
+
+    def test_failed_write_falls_back_to_rewrite(self):
+        """A failed in-place write leaves valid JSON and the items still get saved."""
+        agent_runner.save_json_file(self.outbox_path, [{"id": "a"}])
+
+        with mock.patch.object(agent_runner.os, "fsync", side_effect=OSError("disk full")):
+            agent_runner.append_to_json_array(self.outbox_path, [{"id": "b"}])
+
+        self.assertEqual(json.loads(self.outbox_path.read_text()), [{"id": "a"}, {"id": "b"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for the API's response and file caches.
+"""
+
+import unittest
+import os
+import tempfile
+import shutil
+from pathlib import Path
+from unittest import mock
+
+# The API modules import each other relative to apps/api
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "api"))
+
+from starlette.requests import Request
+
+import http_cache
+from services import file_cache
+
+
+def _request(if_none_match=None):
+    """Build a bare GET request, optionally with an If-None-Match header."""
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+class TestTtlCache(unittest.TestCase):
+    """Test cases for the ttl_cache decorator."""
+
+    def setUp(self):
+        """Wrap a counting function and control the clock."""
+        self.calls = []
+        self.now = 100.0
+        patcher = mock.patch.object(http_cache.time, "monotonic", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        @http_cache.ttl_cache(2.0, maxsize=2)
+        def double(x):
+            self.calls.append(x)
+            return x * 2
+
+        self.double = double
+
+    def test_results_expire_after_ttl(self):
+        """A result is reused within the TTL and recomputed after it."""
+        self.assertEqual(self.double(1), 2)
+        self.now += 1.9
+        self.assertEqual(self.double(1), 2)
+        self.assertEqual(self.calls, [1])
+
+        self.now += 0.1
+        self.double(1)
+        self.assertEqual(self.calls, [1, 1])
+
+    def test_overflow_evicts_oldest_entry_only(self):
+        """Beyond maxsize only the oldest entry is dropped."""
+        self.double(1)
+        self.now += 0.5
+        self.double(2)
+        self.now += 0.5
+        self.double(3)
+
+        self.double(2)
+        self.double(3)
+        self.assertEqual(self.calls, [1, 2, 3])
+        self.double(1)
+        self.assertEqual(self.calls, [1, 2, 3, 1])
+
+
+class TestEtagJsonResponse(unittest.TestCase):
+    """Test cases for ETag responses and If-None-Match handling."""
+
+    def setUp(self):
+        """Fetch the ETag of a sample payload."""
+        self.payload = {"count": 1, "agents": ["CA"]}
+        response = http_cache.etag_json_response(_request(), self.payload)
+        self.etag = response.headers["etag"]
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["cache-control"], http_cache.CACHE_CONTROL)
+
+    def test_matching_tags_get_not_modified(self):
+        """The current tag, a weak form of it, a tag in a list or * all match."""
+        for header in (self.etag, f"W/{self.etag}", f'"stale", {self.etag}', "*"):
+            response = http_cache.etag_json_response(_request(header), self.payload)
+            self.assertEqual(response.status_code, 304, header)
+            self.assertEqual(response.body, b"")
+
+    def test_changed_payload_is_sent_again(self):
+        """A stale tag gets the full body with a new tag."""
+        response = http_cache.etag_json_response(_request(self.etag), {"count": 2, "agents": []})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["etag"], self.etag)
+        self.assertEqual(response.body, b'{"count":2,"agents":[]}')
+
+
+class TestLoadJsonCached(unittest.TestCase):
+    """Test cases for the parsed JSON file cache."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = tempfile.mkdtemp()
+        self.path = Path(self.test_dir) / "scores.json"
+        self.path.write_text('{"a": 1}')
+        os.utime(self.path, ns=(1_000_000_000, 1_000_000_000))
+
+    def tearDown(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.test_dir)
+
+    def test_unchanged_file_is_not_parsed_again(self):
+        """The same parsed object is returned while the signature matches."""
+        first = file_cache.load_json_cached(self.path)
+        self.assertIs(file_cache.load_json_cached(self.path), first)
+
+    def test_mtime_or_size_change_invalidates(self):
+        """A new mtime with the same size, or a new size with the same mtime, reloads."""
+        self.assertEqual(file_cache.load_json_cached(self.path), {"a": 1})
+
+        self.path.write_text('{"a": 2}')
+        os.utime(self.path, ns=(2_000_000_000, 2_000_000_000))
+        self.assertEqual(file_cache.load_json_cached(self.path), {"a": 2})
+
+        self.path.write_text('{"a": 30}')
+        os.utime(self.path, ns=(2_000_000_000, 2_000_000_000))
+        self.assertEqual(file_cache.load_json_cached(self.path), {"a": 30})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Tests for the API's plan and history services.
+"""
+
+import unittest
+import asyncio
+import os
+import json
+import tempfile
+import shutil
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest import mock
+
+# The API modules import each other relative to apps/api
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "api"))
+
+from services import plan_service
+from services.history_service import HistoryService
+
+
+def _plan(plan_id):
+    """Build a minimal valid plan."""
+    return {
+        "metadata": {"plan_id": plan_id, "version": "1.0", "description": f"Plan {plan_id}"},
+        "tasks": [{"task_id": "T1", "agent": "CA", "type": "data_processing",
+                   "description": "Process data", "content": {}}]
+    }
+
+
+class TestPlanService(unittest.TestCase):
+    """Test cases for the in-memory plan store."""
+
+    def setUp(self):
+        """Switch into a temporary directory for the saved plan files."""
+        self.test_dir = tempfile.mkdtemp()
+        self.original_cwd = os.getcwd()
+        os.chdir(self.test_dir)
+        self.service = plan_service.PlanService()
+
+    def tearDown(self):
+        """Clean up test environment."""
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.test_dir)
+
+    def _submit(self, plan_id, execute=False):
+        return asyncio.run(self.service.submit_plan(_plan(plan_id), execute=execute))
+
+    def test_least_recently_used_plans_are_evicted(self):
+        """Beyond the cap, the plan neither submitted nor looked up last is dropped."""
+        with mock.patch.object(plan_service, "MAX_STORED_PLANS", 2):
+            self._submit("P1")
+            self._submit("P2")
+            self.assertIsNotNone(asyncio.run(self.service.get_plan_status("P1")))
+            self._submit("P3")
+
+        self.assertIsNone(asyncio.run(self.service.get_plan_status("P2")))
+        listed = [plan["plan_id"] for plan in asyncio.run(self.service.list_plans())]
+        self.assertEqual(sorted(listed), ["P1", "P3"])
+
+    def test_status_omits_execution_id_until_executed(self):
+        """Only plans that were executed report an execution ID."""
+        self._submit("P1")
+        self._submit("P2", execute=True)
+
+        self.assertNotIn("execution_id", asyncio.run(self.service.get_plan_status("P1")))
+        self.assertTrue(asyncio.run(self.service.get_plan_status("P2"))["execution_id"])
+
+    def test_created_at_is_utc(self):
+        """Plans are stamped with an aware UTC time, like the plan model."""
+        self._submit("P1")
+
+        created_at = asyncio.run(self.service.get_plan_status("P1"))["created_at"]
+        self.assertEqual(created_at.utcoffset(), timedelta(0))
+        self.assertTrue(asyncio.run(self.service.list_plans())[0]["created_at"].endswith("+00:00"))
+
+    def test_list_plans_filters_by_status(self):
+        """Only plans with the requested status are listed."""
+        self._submit("P1")
+        self._submit("P2", execute=True)
+
+        processing = asyncio.run(self.service.list_plans(status="processing"))
+        self.assertEqual([plan["plan_id"] for plan in processing], ["P2"])
+        self.assertEqual(processing[0]["task_count"], 1)
+        self.assertEqual(len(asyncio.run(self.service.list_plans())), 2)
+        self.assertEqual(asyncio.run(self.service.list_plans(status="failed")), [])
+
+
+class TestHistoryService(unittest.TestCase):
+    """Test cases for plan history and recent task ordering."""
+
+    def setUp(self):
+        """Set up an empty logs, plans and postbox layout."""
+        self.test_dir = tempfile.mkdtemp()
+        self.base = Path(self.test_dir)
+        for name in ("logs", "plans", "postbox/CA"):
+            (self.base / name).mkdir(parents=True)
+        self.service = HistoryService(self.test_dir)
+
+    def tearDown(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.test_dir)
+
+    def test_plan_history_reads_newest_files(self):
+        """The newest plan files by mtime are returned, not the first listed."""
+        for i in range(5):
+            plan_file = self.base / "plans" / f"plan-{i}.yaml"
+            plan_file.write_text("tasks: []\n")
+            os.utime(plan_file, (1_000_000_000 + i * 60,) * 2)
+
+        history = self.service.get_plan_history(limit=2)
+        self.assertEqual([plan.plan_id for plan in history], ["plan-4", "plan-3"])
+
+    def test_plan_history_mixes_naive_and_utc_times(self):
+        """Plan files (local times) and execution logs (UTC) sort together."""
+        plan_file = self.base / "plans" / "local-plan.yaml"
+        plan_file.write_text("tasks: []\n")
+        os.utime(plan_file, (1_000_000_000,) * 2)
+        (self.base / "logs" / "plan_run.json").write_text(json.dumps(
+            {"plan_id": "utc-plan", "start_time": "2001-09-09T02:00:00Z", "status": "complete"}
+        ))
+
+        history = self.service.get_plan_history(limit=10)
+        self.assertEqual([plan.plan_id for plan in history], ["utc-plan", "local-plan"])
+
+    def test_recent_tasks_mix_naive_and_utc_times(self):
+        """Score log (local) and outbox (UTC) entries are ordered newest first."""
+        now = datetime.now()
+        utc_now = datetime.now(timezone.utc)
+        scores = [
+            {"agent_id": "CA", "task_id": "T-local-old", "timestamp": (now - timedelta(hours=2)).isoformat(), "score": 1},
+            {"agent_id": "CA", "task_id": "T-local-new", "timestamp": (now - timedelta(minutes=1)).isoformat()},
+            {"agent_id": "CA", "task_id": "T-stale", "timestamp": (now - timedelta(days=3)).isoformat()},
+        ]
+        (self.base / "logs" / "agent_scores.json").write_text(json.dumps(scores))
+        outbox = [{
+            "id": "m1", "sender": "CA",
+            "timestamp": (utc_now - timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "content": {"task_id": "T-utc", "status": "completed"}
+        }]
+        (self.base / "postbox" / "CA" / "outbox.json").write_text(json.dumps(outbox))
+
+        tasks = self.service.get_recent_tasks(limit=10, hours=24)
+        self.assertEqual([task.task_id for task in tasks], ["T-local-new", "T-utc", "T-local-old"])
+        self.assertIsInstance(tasks[-1].score, float)
+
+
+if __name__ == "__main__":
+    unittest.main()
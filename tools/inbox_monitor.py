@@ -11,7 +11,9 @@ import os
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
+
+import orjson
 
 # Base directory for agent communication
 BASE_DIR = Path(__file__).parent.parent / "postbox"
@@ -42,21 +44,36 @@ def get_available_agents() -> List[str]:
         return []
     return [d.name for d in BASE_DIR.iterdir() if d.is_dir()]
 
+def read_ndjson_inbox(inbox_path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield the messages of an NDJSON inbox, one JSON object per line."""
+    with open(inbox_path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
 def load_messages(agent: str) -> List[Dict[str, Any]]:
-    """Load messages from an agent's inbox."""
+    """Load messages from an agent's inbox.json, then any from its inbox.ndjson."""
+    messages = []
+    
     inbox_path = BASE_DIR / agent / "inbox.json"
-    if not inbox_path.exists():
-        return []
+    if inbox_path.exists():
+        try:
+            with open(inbox_path, 'r') as f:
+                inbox = json.load(f)
+                if isinstance(inbox, list):
+                    messages.extend(inbox)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Error reading {inbox_path}: {e}", file=sys.stderr)
     
-    try:
-        with open(inbox_path, 'r') as f:
-            messages = json.load(f)
-            if not isinstance(messages, list):
-                return []
-            return messages
-    except (json.JSONDecodeError, IOError) as e:
-        print(f"Error reading {inbox_path}: {e}", file=sys.stderr)
-        return []
+    # The API appends HUMAN escalations to inbox.ndjson
+    ndjson_path = BASE_DIR / agent / "inbox.ndjson"
+    if ndjson_path.exists():
+        try:
+            messages.extend(read_ndjson_inbox(ndjson_path))
+        except (orjson.JSONDecodeError, IOError) as e:
+            print(f"Error reading {ndjson_path}: {e}", file=sys.stderr)
+    
+    return messages
 
 def format_timestamp(timestamp: str) -> str:
     """Format ISO timestamp to a more readable format."""